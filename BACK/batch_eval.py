@@ -0,0 +1,94 @@
+"""
+Helpers for evaluating many answers through the OpenAI-compatible Batch API.
+Requests are uploaded as one JSONL file and answered asynchronously (within 24h) at a reduced price;
+main.py submits the jobs and ingests the results into AssessmentResult.
+"""
+import hashlib
+import re
+from typing import Iterable, Optional
+
+import json_utils
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+BATCH_COMPLETION_WINDOW = "24h"
+
+
+_DIGEST = re.compile(r"[0-9a-f]{16}")
+
+
+def answer_digest(answer_text: str) -> str:
+    """Short fingerprint of the answer text a batch request was built from."""
+    return hashlib.sha256(answer_text.encode("utf-8")).hexdigest()[:16]
+
+
+def make_custom_id(applicant_id: int, q_id: str, answer_text: str) -> str:
+    """Identify one batch request as applicant:answer digest:q_id.
+
+    The output file only echoes custom_id, so the digest rides along in it to tell whether
+    the answer was edited after submission. q_ids may contain ':', so it comes last.
+    """
+    return f"{applicant_id}:{answer_digest(answer_text)}:{q_id}"
+
+
+def split_custom_id(custom_id: str) -> tuple[int, str, Optional[str]]:
+    """(applicant_id, q_id, answer digest); the digest is None for jobs submitted without one."""
+    applicant_id, rest = custom_id.split(":", 1)
+    digest, sep, q_id = rest.partition(":")
+    if sep and _DIGEST.fullmatch(digest):
+        return int(applicant_id), q_id, digest
+    return int(applicant_id), rest, None
+
+
+def build_batch_file(model_name: str, prompts: Iterable[tuple[str, str]]) -> bytes:
+    """Render (custom_id, prompt) pairs as the JSONL body expected by files.create(purpose="batch")."""
+    return b"\n".join(
+        json_utils.dumps_bytes({
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": BATCH_ENDPOINT,
+            "body": {
+                "model": model_name,
+                "messages": [{"role": "user", "content": prompt}],
+                "temperature": 0
+            }
+        })
+        for custom_id, prompt in prompts
+    ) + b"\n"
+
+
+def parse_batch_output(data: bytes) -> tuple[dict[str, str], dict[str, str]]:
+    """Split a batch output (or error) file into ({custom_id: reply text}, {custom_id: error})."""
+    replies: dict[str, str] = {}
+    errors: dict[str, str] = {}
+    for line in data.splitlines():
+        if not line.strip():
+            continue
+        record = json_utils.loads(line)
+        custom_id = record.get("custom_id")
+        if not custom_id:
+            continue
+
+        error = _record_error(record)
+        if error:
+            errors[custom_id] = error
+            continue
+        try:
+            replies[custom_id] = record["response"]["body"]["choices"][0]["message"]["content"]
+        except (KeyError, IndexError, TypeError):
+            errors[custom_id] = "Malformed batch response"
+    return replies, errors
+
+
+def _record_error(record: dict) -> Optional[str]:
+    error = record.get("error")
+    if error:
+        return error.get("message") if isinstance(error, dict) else str(error)
+    response = record.get("response") or {}
+    status_code = response.get("status_code")
+    if status_code is not None and status_code != 200:
+        body = response.get("body") or {}
+        body_error = body.get("error") if isinstance(body, dict) else None
+        if isinstance(body_error, dict) and body_error.get("message"):
+            return body_error["message"]
+        return f"HTTP {status_code}"
+    return None
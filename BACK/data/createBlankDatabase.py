@@ -1,35 +1,119 @@
+import os
 from pathlib import Path
 from sqlmodel import SQLModel, create_engine, Session
 from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.pool import StaticPool
 
-from models import Applicant, Question, ApplicantAnswer, AssessmentResult, SearchKeyword, LLMConfig, PDFOCRCache
+import json_utils
+from models import Applicant, Question, ApplicantAnswer, AssessmentResult, SearchKeyword, LLMConfig, PDFOCRCache, LLMResponseCache, AnswerEmbedding, EvaluationBatch
 
 DATABASE_DIR = Path(__file__).resolve().parent
 DATABASE_DIR.mkdir(exist_ok=True)
 DATABASE_URL = f"sqlite:///{DATABASE_DIR / 'tender_evaluation.db'}"
 
-# Enable foreign key constraints for SQLite (required for CASCADE DELETE)
-engine = create_engine(
-    DATABASE_URL,
-    echo=True,
-    connect_args={"check_same_thread": False}
-)
+# SQL statement logging is expensive on hot paths; opt in with SQL_ECHO=1
+SQL_ECHO = os.getenv("SQL_ECHO") == "1"
 
-# Enable foreign keys for each connection
+if ":memory:" in DATABASE_URL:
+    # An in-memory database only exists on its one connection
+    engine = create_engine(
+        DATABASE_URL,
+        echo=SQL_ECHO,
+        json_serializer=json_utils.dumps,
+        json_deserializer=json_utils.loads,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+else:
+    # Pool sized for concurrent requests plus the OCR worker threads. Each SQLite
+    # connection may hold a 64 MB page cache, so keep the pool modest; the overflow
+    # connections are closed again once returned.
+    # Sync endpoints and their session dependency run on FastAPI's threadpool (40 threads).
+    # With fewer connections than threads, threads blocked waiting for a connection can
+    # starve the session teardowns that would return one, so 10 + 30 covers every thread.
+    engine = create_engine(
+        DATABASE_URL,
+        echo=SQL_ECHO,
+        json_serializer=json_utils.dumps,
+        json_deserializer=json_utils.loads,
+        pool_size=int(os.getenv("DB_POOL_SIZE", "10")),
+        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "30")),
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        connect_args={"check_same_thread": False}
+    )
+
+# Enable foreign keys and performance settings for each connection
 @event.listens_for(engine, "connect")
 def set_sqlite_pragma(dbapi_conn, connection_record):
-    """Enable foreign key constraints for each new connection"""
+    """Enable foreign key constraints and tune SQLite for each new connection"""
     cursor = dbapi_conn.cursor()
     cursor.execute("PRAGMA foreign_keys=ON")
+    # WAL lets readers run alongside the writer and needs fewer fsyncs per commit
+    if ":memory:" not in DATABASE_URL:
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        # Checkpoint every ~1000 pages so bursts of OCR cache writes cannot grow the WAL unbounded
+        cursor.execute("PRAGMA wal_autocheckpoint=1000")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+    cursor.execute("PRAGMA cache_size=-65536")  # 64 MB
+    cursor.execute("PRAGMA busy_timeout=5000")
     cursor.close()
 
 
-def create_db_and_tables():
-    """Create all database tables."""
+def create_db_and_tables() -> bool:
+    """Create all database tables and any indexes missing from an existing database.
+
+    Returns False when a unique index could not be built because of duplicate rows.
+    """
     SQLModel.metadata.create_all(engine)
+    # create_all skips tables that already exist, so indexes added later need their own pass
+    complete = True
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            try:
+                index.create(engine, checkfirst=True)
+            except IntegrityError:
+                print(f"Warning: could not create unique index {index.name}: duplicate rows in {table.name}.")
+                if table.name in ("applicantanswer", "assessmentresult"):
+                    print("Run migrate_unique_answer_indexes.py")
+                complete = False
+    return complete
+
+
+# Bump whenever a table or index is added so existing databases pick it up on the next start
+SCHEMA_VERSION = 6
+
+
+def init_db_if_needed() -> bool:
+    """Run create_db_and_tables() only when the database's user_version is behind SCHEMA_VERSION.
+
+    Returns True when the schema was (re)created.
+    """
+    with engine.connect() as conn:
+        version = conn.exec_driver_sql("PRAGMA user_version").scalar()
+    if version >= SCHEMA_VERSION:
+        return False
+
+    if not create_db_and_tables():
+        # Leave the version behind so the next start retries the missing indexes
+        return True
+    with engine.begin() as conn:
+        conn.exec_driver_sql(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    return True
+
+
+def optimize_db():
+    """Refresh SQLite query planner statistics (cheap, run on shutdown)."""
+    with engine.connect() as conn:
+        conn.exec_driver_sql("PRAGMA optimize")
 
 
 def get_session():
     """Get database session."""
-    with Session(engine) as session:
+    # Request sessions end right after their last commit, so keep the committed state in memory
+    # instead of reloading every object with another SELECT on its next attribute access
+    with Session(engine, expire_on_commit=False) as session:
         yield session
@@ -1,14 +1,17 @@
 import argparse
-import json
 import os
+from datetime import datetime
 from pathlib import Path
 
+from sqlalchemy import insert
 from sqlmodel import Session, SQLModel, create_engine, select
 
+import json_utils
 from models import Question
 
 DATA_DIR = Path(__file__).resolve().parent
 DEFAULT_DB_URL = f"sqlite:///{DATA_DIR / 'tender_evaluation.db'}"
+BATCH_SIZE = 1000
 
 
 def _get_db_url() -> str:
@@ -20,49 +23,60 @@ def _ensure_tables(engine):
 
 
 def _ensure_blank(session: Session):
-    existing = session.exec(select(Question).limit(1)).first()
-    if existing:
+    existing = session.exec(select(Question.id).limit(1)).first()
+    if existing is not None:
         raise RuntimeError("Question table is not empty. Use a blank database.")
 
 
 def _load_payload(path: Path):
-    payload = json.loads(path.read_text(encoding="utf-8"))
+    payload = json_utils.loads(path.read_bytes())
     if not isinstance(payload, list):
         raise ValueError("Seed file must contain a JSON array of questions")
     return payload
 
 
+_loads = json_utils.loads
+
+
 def _to_prompt_json(value):
-    if isinstance(value, str):
+    # Seed entries are usually dicts; exact type check avoids an MRO walk per row
+    if type(value) is not str:
         return value
-    return json.dumps(value, ensure_ascii=True)
+    try:
+        return _loads(value)
+    except json_utils.JSONDecodeError:
+        return {"raw": value}
+
+
+def _to_row(entry, q_id: str, created_at: datetime):
+    return {
+        "q_id": q_id,
+        "prompt_json": _to_prompt_json(entry.get("prompt_json", {})),
+        "created_at": created_at,
+        "is_active": bool(entry.get("is_active", True)),
+        "search_label": entry.get("search_label", "Criterion"),
+        "auto_increment": bool(entry.get("auto_increment", True)),
+    }
 
 
 def import_questions(seed_path: Path, engine):
-    with Session(engine) as session:
+    payload = _load_payload(seed_path)
+    now = datetime.utcnow()
+    rows = []
+    for entry in payload:
+        q_id = str(entry.get("q_id", "")).strip()
+        if q_id:
+            rows.append(_to_row(entry, q_id, now))
+
+    # One explicit transaction for the whole import; plain dict rows skip the
+    # ORM unit of work and go out as executemany INSERTs
+    with Session(engine, autoflush=False) as session, session.begin():
         _ensure_blank(session)
 
-        payload = _load_payload(seed_path)
-        created = 0
-        for entry in payload:
-            q_id = str(entry.get("q_id", "")).strip()
-            if not q_id:
-                continue
-
-            session.add(
-                Question(
-                    q_id=q_id,
-                    prompt_json=_to_prompt_json(entry.get("prompt_json", {})),
-                    is_active=bool(entry.get("is_active", True)),
-                    search_label=entry.get("search_label", "Criterion"),
-                    auto_increment=bool(entry.get("auto_increment", True)),
-                )
-            )
-            created += 1
-
-        session.commit()
-
-    print(f"Imported {created} questions into blank table.")
+        for start in range(0, len(rows), BATCH_SIZE):
+            session.execute(insert(Question), rows[start:start + BATCH_SIZE])
+
+    print(f"Imported {len(rows)} questions into blank table.")
 
 
 def main():
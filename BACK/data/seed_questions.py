@@ -1,14 +1,16 @@
 import argparse
-import json
 import os
 import sys
+from datetime import datetime
 from pathlib import Path
 
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlmodel import Session, SQLModel, create_engine, select
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 sys.path.append(str(PROJECT_ROOT))
 
+import json_utils
 from models import Question
 
 DATA_DIR = Path(__file__).resolve().parent
@@ -24,13 +26,18 @@ def _ensure_tables(engine):
     SQLModel.metadata.create_all(engine)
 
 
+_loads = json_utils.loads
+
+
 def _normalize_prompt_json(value):
-    if isinstance(value, str):
-        try:
-            return json.loads(value)
-        except json.JSONDecodeError:
-            return {"raw": value}
-    return value
+    # Prompts are dicts; strings come from old seed files and pre-migration databases.
+    # Exact type check avoids an MRO walk per row
+    if type(value) is not str:
+        return value
+    try:
+        return _loads(value)
+    except json_utils.JSONDecodeError:
+        return {"raw": value}
 
 
 def export_questions(output_path: Path, engine):
@@ -49,7 +56,7 @@ def export_questions(output_path: Path, engine):
             )
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(payload, indent=2, ensure_ascii=True), encoding="utf-8")
+    output_path.write_bytes(json_utils.dumps_bytes(payload, indent=True))
     print(f"Exported {len(payload)} questions to {output_path}")
 
 
@@ -57,43 +64,52 @@ def import_questions(input_path: Path, engine):
     if not input_path.exists():
         raise FileNotFoundError(f"Seed file not found: {input_path}")
 
-    payload = json.loads(input_path.read_text(encoding="utf-8"))
+    payload = json_utils.loads(input_path.read_bytes())
     if not isinstance(payload, list):
         raise ValueError("Seed file must contain a JSON array of questions")
 
-    with Session(engine) as session:
-        created = 0
-        updated = 0
-        for entry in payload:
-            q_id = str(entry.get("q_id", "")).strip()
-            if not q_id:
-                continue
-
-            prompt_json = entry.get("prompt_json", {})
-            if not isinstance(prompt_json, str):
-                prompt_json = json.dumps(prompt_json, ensure_ascii=True)
-
-            existing = session.exec(select(Question).where(Question.q_id == q_id)).first()
-            if existing:
-                existing.prompt_json = prompt_json
-                existing.is_active = bool(entry.get("is_active", True))
-                existing.search_label = entry.get("search_label", "Criterion")
-                existing.auto_increment = bool(entry.get("auto_increment", True))
-                session.add(existing)
-                updated += 1
-            else:
-                session.add(
-                    Question(
-                        q_id=q_id,
-                        prompt_json=prompt_json,
-                        is_active=bool(entry.get("is_active", True)),
-                        search_label=entry.get("search_label", "Criterion"),
-                        auto_increment=bool(entry.get("auto_increment", True)),
-                    )
-                )
-                created += 1
-
-        session.commit()
+    now = datetime.utcnow()
+    rows = []
+    for entry in payload:
+        q_id = str(entry.get("q_id", "")).strip()
+        if not q_id:
+            continue
+
+        prompt_json = _normalize_prompt_json(entry.get("prompt_json", {}))
+
+        rows.append(
+            {
+                "q_id": q_id,
+                "prompt_json": prompt_json,
+                "created_at": now,
+                "is_active": bool(entry.get("is_active", True)),
+                "search_label": entry.get("search_label", "Criterion"),
+                "auto_increment": bool(entry.get("auto_increment", True)),
+            }
+        )
+
+    # Single upsert keyed on the unique q_id instead of SELECT-then-UPDATE per row
+    stmt = sqlite_insert(Question.__table__)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Question.__table__.c.q_id],
+        set_={
+            "prompt_json": stmt.excluded.prompt_json,
+            "is_active": stmt.excluded.is_active,
+            "search_label": stmt.excluded.search_label,
+            "auto_increment": stmt.excluded.auto_increment,
+        },
+    )
+
+    # One explicit transaction for the whole import instead of one per autoflush
+    with Session(engine, autoflush=False) as session, session.begin():
+        # One prefetch of existing keys replaces a per-row existence query
+        existing = set(session.exec(select(Question.q_id)).all())
+        incoming = {row["q_id"] for row in rows}
+        updated = len(incoming & existing)
+        created = len(incoming) - updated
+
+        if rows:
+            session.execute(stmt, rows)
 
     print(f"Imported questions. Created: {created}, Updated: {updated}")
 
@@ -0,0 +1,46 @@
+"""
+JSON helpers for the seed/import scripts and the API.
+Uses orjson when installed (much faster parse/serialize) and falls back to the stdlib json module.
+"""
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is listed in requirements.txt
+    orjson = None
+
+
+if orjson is not None:
+    JSONDecodeError = orjson.JSONDecodeError
+
+    def loads(data: str | bytes) -> Any:
+        """Parse JSON from str or bytes (bytes skip the UTF-8 decode step)."""
+        return orjson.loads(data)
+
+    def dumps(value: Any) -> str:
+        """Serialize to a compact JSON string."""
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+    def dumps_bytes(value: Any, indent: bool = False) -> bytes:
+        """Serialize to UTF-8 encoded JSON bytes, optionally indented by 2 spaces."""
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(value, option=option)
+else:
+    JSONDecodeError = json.JSONDecodeError
+
+    def loads(data: str | bytes) -> Any:
+        """Parse JSON from str or bytes."""
+        return json.loads(data)
+
+    def dumps(value: Any) -> str:
+        """Serialize to a compact JSON string."""
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+    def dumps_bytes(value: Any, indent: bool = False) -> bytes:
+        """Serialize to UTF-8 encoded JSON bytes, optionally indented by 2 spaces."""
+        if indent:
+            return json.dumps(value, indent=2, ensure_ascii=False).encode("utf-8")
+        return dumps(value).encode("utf-8")
@@ -1,64 +1,145 @@
-from fastapi import FastAPI, UploadFile, File, Form, HTTPException, Depends
+from fastapi import FastAPI, UploadFile, File, Form, HTTPException, Depends, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
+from fastapi.concurrency import run_in_threadpool
 from dotenv import load_dotenv
 import os
 import base64
 from datetime import datetime
 from pathlib import Path
-import shutil
-from typing import Optional
+import aiofiles
+import uuid
+import hashlib
+from typing import AsyncIterator, List, Optional
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from sqlmodel import Session, select
-from data.createBlankDatabase import create_db_and_tables, get_session, engine
-from models import Applicant, Question, ApplicantAnswer, AssessmentResult, SearchKeyword, LLMConfig, PDFOCRCache
+from sqlalchemy import bindparam, func, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from data.createBlankDatabase import init_db_if_needed, get_session, engine, optimize_db
+from models import Applicant, Question, ApplicantAnswer, AssessmentResult, SearchKeyword, LLMConfig, PDFOCRCache, LLMResponseCache, AnswerEmbedding, EvaluationBatch
 import json
+import json_utils
+import batch_eval
+import fastjsonschema
+import semantic_cache
+import asyncio
 import openai
+import httpx
 import re
-import fitz
-from ocr_utils import extract_text_hybrid, get_page_hash
+import string
+from ocr_utils import extract_page, extract_pages_hybrid, open_pdf
 import subprocess
 import sys
+import threading
+import time
+
+try:
+    # Optional Brotli compression for clients that accept "br"; gzip is used otherwise
+    from brotli_asgi import BrotliMiddleware
+except ImportError:
+    BrotliMiddleware = None
 
 # Load environment variables from .env file
 load_dotenv()
 
-# LLM clients
-eea_client = openai.OpenAI(
+try:
+    # HTTP/2 multiplexes concurrent evaluations over one connection per LLM host
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# One pooled HTTP client shared by all LLM clients, so connections (and TLS
+# sessions) are reused across requests
+http_client = httpx.AsyncClient(
+    http2=HTTP2_AVAILABLE,
+    timeout=httpx.Timeout(120.0, connect=10.0),
+    limits=httpx.Limits(max_keepalive_connections=64, max_connections=128)
+)
+
+# LLM clients (async so concurrent evaluations don't block the worker)
+eea_client = openai.AsyncOpenAI(
     api_key=os.getenv("EEA_API_KEY"),
-    base_url=os.getenv("EEA_BASE_URL")
+    base_url=os.getenv("EEA_BASE_URL"),
+    http_client=http_client
 )
 
-# Optional OpenAI client (created lazily)
+# Optional OpenAI client for evaluations (created lazily)
 openai_client = None
 
+# Optional sync OpenAI client for OCR, created lazily and shared by the OCR worker threads
+ocr_openai_client = None
+_ocr_client_lock = threading.Lock()
+
 # Create uploads directory if it doesn't exist
 UPLOAD_DIR = Path("uploads")
 UPLOAD_DIR.mkdir(exist_ok=True)
 
-app = FastAPI(
-    title="Tender Evaluation API",
-    docs_url="/swagger",
-    redoc_url="/redoc"
-)
+# Leading pages inspected to decide whether a PDF is image-only
+SCANNED_SAMPLE_PAGES = 3
 
-# Configure CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Configure as needed for production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Scanned pages OCR'd concurrently when the section search reaches a page without text
+OCR_PREFETCH_PAGES = int(os.getenv("OCR_PREFETCH_PAGES", "8"))
+
+# Parsed prompt_json per q_id. Filled at startup and kept in step by this process's
+# /questions endpoints. Entries are dropped every QUESTION_CACHE_TTL seconds so edits made
+# by other workers or the seed/import scripts are picked up by the next lookup.
+QUESTION_CACHE: dict[str, dict] = {}
+QUESTION_CACHE_TTL = 5.0
+_question_cache_expires = time.monotonic() + QUESTION_CACHE_TTL
 
-@app.on_event("startup")
-def on_startup():
-    """Initialize database on application startup"""
-    create_db_and_tables()
+# Serialized /search-keywords response, reused for up to KEYWORDS_CACHE_TTL seconds while the
+# (MAX(created_at), COUNT(*)) probe and the write generation are unchanged. The endpoints
+# below bump the generation; the TTL bounds staleness after edits made outside this process.
+KEYWORDS_CACHE_TTL = 5.0
+_keywords_cache: Optional[dict] = None
+_keywords_generation = 0
+
+# Anything but letters, digits, space, '-' and '_' is dropped from vendor file names
+# (\w is Unicode-aware, so accented vendor names survive as before)
+_UNSAFE_VENDOR_CHARS = re.compile(r"[^\w \-]")
+
+# Upper bound on LLM requests in flight across all evaluations, to stay within provider rate limits
+LLM_SEMAPHORE = asyncio.BoundedSemaphore(int(os.getenv("LLM_CONCURRENCY", "8")))
+
+# Reuse stored replies for identical (provider, model, prompt) requests; LLM_RESPONSE_CACHE=0 disables it
+LLM_RESPONSE_CACHE = os.getenv("LLM_RESPONSE_CACHE", "1") != "0"
+
+# Reuse the reply of an earlier answer to the same question whose embedding is at least this
+# similar (cosine, e.g. 0.97); unset disables the semantic cache
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD") or 0) or None
+EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL") or "text-embedding-3-small"
+
+# Upper bound on uploads written to disk concurrently
+UPLOAD_SEMAPHORE = asyncio.BoundedSemaphore(int(os.getenv("UPLOAD_CONCURRENCY", "8")))
+
+# Read/write size when copying uploads to disk
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Largest PDF accepted per file (MAX_UPLOAD_MB, default 100 MB)
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_MB", "100")) * 1024 * 1024
+
+# Accepted upload file name suffixes, compared case-insensitively
+PDF_EXTENSIONS = (".pdf",)
+
+# PDF readers accept the %PDF- header anywhere in the first KiB
+PDF_MAGIC = b"%PDF-"
+PDF_MAGIC_WINDOW = 1024
+
+def _init_db_and_caches():
+    """Initialize the database and warm the in-process caches"""
+    # Only touches the schema when PRAGMA user_version says it is behind
+    init_db_if_needed()
 
     # Check if Question table is empty and seed if needed
     with Session(engine) as session:
-        existing_questions = session.exec(select(Question).limit(1)).first()
+        existing_questions = session.exec(select(Question.id).limit(1)).first()
 
-        if not existing_questions:
+        if existing_questions is None:
             print("Database is empty. Seeding questions from questions_seed.json...")
             seed_script = Path(__file__).parent / "data" / "seed_questions.py"
             seed_file = Path(__file__).parent / "data" / "questions_seed.json"
@@ -79,25 +160,159 @@ def on_startup():
             else:
                 print(f"Warning: Seed script or data file not found at {seed_script} or {seed_file}")
 
+        # Parse the active question prompts once instead of on every evaluation
+        for q_id, prompt_json in session.exec(
+            select(Question.q_id, Question.prompt_json).where(Question.is_active == True)
+        ):
+            try:
+                QUESTION_CACHE[q_id] = _prompt_dict(prompt_json)
+            except json_utils.JSONDecodeError:
+                print(f"Warning: Question {q_id} has invalid prompt_json")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Set up the database on startup; close pooled LLM connections and refresh SQLite statistics on shutdown"""
+    await run_in_threadpool(_init_db_and_caches)
+    yield
+    await http_client.aclose()
+    if ocr_openai_client is not None:
+        ocr_openai_client.close()
+    optimize_db()
+
+app = FastAPI(
+    title="Tender Evaluation API",
+    lifespan=lifespan,
+    # orjson renders response bodies several times faster than the stdlib encoder
+    default_response_class=ORJSONResponse if json_utils.orjson is not None else JSONResponse,
+    docs_url="/swagger",
+    redoc_url="/redoc"
+)
+
+class UploadSizeLimitMiddleware:
+    """Reject single-file uploads whose Content-Length exceeds MAX_UPLOAD_BYTES before the body is read.
+
+    Runs ahead of FastAPI's multipart parsing, which would otherwise spool the
+    whole body first. Bodies without a Content-Length are capped while streaming
+    to disk in _save_upload().
+    """
+
+    paths = frozenset({"/upload", "/upload/stream"})
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] in self.paths:
+            for name, value in scope["headers"]:
+                if name == b"content-length":
+                    if value.isdigit() and int(value) > MAX_UPLOAD_BYTES:
+                        response = JSONResponse(
+                            {"detail": f"File too large (limit {MAX_UPLOAD_BYTES // (1024 * 1024)} MB)"},
+                            status_code=413
+                        )
+                        await response(scope, receive, send)
+                        return
+                    break
+        await self.app(scope, receive, send)
+
+
+app.add_middleware(UploadSizeLimitMiddleware)
+
+# Compress JSON responses such as the /uploads list; level 5 keeps most of the size win for far less CPU than 9.
+# Responses below 1 KB aren't worth it, and this app returns no binary files.
+if BrotliMiddleware is not None:
+    # Added first so it sits inside GZipMiddleware: a "br" response already carries Content-Encoding,
+    # which GZip leaves alone, and clients without "br" still get level-5 gzip instead of
+    # brotli-asgi's own level-9 fallback
+    app.add_middleware(BrotliMiddleware, quality=4, minimum_size=1024, gzip_fallback=False)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# Configure CORS (comma-separated CORS_ORIGINS; defaults to the Vite dev server)
+CORS_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("CORS_ORIGINS", "http://localhost:5173,http://127.0.0.1:5173").split(",")
+    if origin.strip()
+]
+
+class CachedCORSMiddleware(CORSMiddleware):
+    """CORSMiddleware with the per-request lookups precomputed.
+
+    Starlette already joins the Allow-Methods/Allow-Headers/Max-Age strings
+    once in ``__init__``; what remains per request are list scans of
+    ``allow_origins`` and ``allow_methods``, so keep those as frozensets instead.
+    """
+
+    def __init__(self, app, **kwargs):
+        super().__init__(app, **kwargs)
+        self.allow_origins = frozenset(self.allow_origins)
+        self.allow_methods = frozenset(self.allow_methods)
+
+
+app.add_middleware(
+    CachedCORSMiddleware,
+    allow_origins=CORS_ORIGINS,
+    # Optional pattern for origins that can't be listed (e.g. preview deployments); compiled once
+    allow_origin_regex=os.getenv("CORS_ORIGIN_REGEX") or None,
+    allow_credentials=True,
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE"],
+    allow_headers=["*"],
+    max_age=86400,  # Let browsers cache preflight responses for a day
+)
+
+# Decodes one JSON value from an offset and reports where it ended, ignoring what follows
+_JSON_DECODER = json.JSONDecoder()
+
 def _extract_json_payload(content: str):
     content = content.strip()
     if not content:
         return None
     try:
-        return json.loads(content)
-    except json.JSONDecodeError:
+        return json_utils.loads(content)
+    except json_utils.JSONDecodeError:
         pass
 
+    # Prose around the JSON: parse the first object that decodes, starting at each '{' in turn
     start = content.find("{")
-    end = content.rfind("}")
-    if start == -1 or end == -1 or end <= start:
-        return None
-
-    candidate = content[start:end + 1]
-    try:
-        return json.loads(candidate)
-    except json.JSONDecodeError:
-        return None
+    while start != -1:
+        try:
+            return _JSON_DECODER.raw_decode(content, start)[0]
+        except json.JSONDecodeError:
+            start = content.find("{", start + 1)
+    return None
+
+class _SafeDict(dict):
+    def __missing__(self, key):
+        return "{" + key + "}"
+
+@lru_cache(maxsize=256)
+def _compiled_template(template: str) -> tuple[tuple[str, str | None], ...] | None:
+    """
+    Split a prompt template into (literal, field name) parts once.
+    Returns None when a field uses a format spec, conversion or attribute/index
+    lookup, which only str.format_map can render.
+    """
+    parts = []
+    for literal, field, format_spec, conversion in string.Formatter().parse(template):
+        if field is not None and (format_spec or conversion or not field.isidentifier()):
+            return None
+        parts.append((literal, field))
+    return tuple(parts)
+
+# Serialized prompt JSON for the no-template prompt, keyed by the prompt dict's identity.
+# Prompt dicts come from QUESTION_CACHE and are replaced, never mutated, when a question
+# changes; each entry keeps its dict alive so the id cannot be reused while cached.
+_PROMPT_JSON_CACHE: dict[int, tuple[dict, str]] = {}
+_PROMPT_JSON_CACHE_SIZE = 256
+
+def _serialized_prompt(prompt_data: dict) -> str:
+    cached = _PROMPT_JSON_CACHE.get(id(prompt_data))
+    if cached is not None and cached[0] is prompt_data:
+        return cached[1]
+    if len(_PROMPT_JSON_CACHE) >= _PROMPT_JSON_CACHE_SIZE:
+        _PROMPT_JSON_CACHE.clear()
+    prompt_json = json.dumps(prompt_data, ensure_ascii=True)
+    _PROMPT_JSON_CACHE[id(prompt_data)] = (prompt_data, prompt_json)
+    return prompt_json
 
 def _build_prompt(prompt_data: dict, answer_text: str) -> str:
     template = prompt_data.get("prompt_template")
@@ -111,13 +326,17 @@ def _build_prompt(prompt_data: dict, answer_text: str) -> str:
             "question_text": question_text
         })
 
-        class _SafeDict(dict):
-            def __missing__(self, key):
-                return "{" + key + "}"
-
-        return template.format_map(_SafeDict(values))
+        parts = _compiled_template(template)
+        if parts is None:
+            return template.format_map(_SafeDict(values))
+        # Unknown placeholders are left as-is, like _SafeDict does
+        return "".join(
+            literal if field is None
+            else literal + (str(values[field]) if field in values else "{" + field + "}")
+            for literal, field in parts
+        )
 
-    prompt_json = json.dumps(prompt_data, ensure_ascii=True)
+    prompt_json = _serialized_prompt(prompt_data)
     return (
         "You are evaluating a tender proposal answer using the following prompt JSON.\n"
         "Return only the evaluation result in JSON.\n\n"
@@ -138,71 +357,179 @@ def _get_model_for_provider(provider: str) -> tuple[str | None, str]:
     return os.getenv("EEA_MODEL"), "EEA In-house LLM"
 
 def _get_openai_client():
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
-        return None
-    return openai.OpenAI(
-        api_key=api_key,
-        base_url=os.getenv("OPENAI_BASE_URL") or "https://api.openai.com/v1"
-    )
-
-def _extract_criterion_paragraph(pdf_path: Path, question, session: Session, applicant_id: Optional[int] = None) -> tuple[str, str] | None:
-    if not pdf_path.exists():
-        return None
+    global ocr_openai_client
+    if ocr_openai_client is None:
+        api_key = os.getenv("OPENAI_API_KEY")
+        if not api_key:
+            return None
+        with _ocr_client_lock:
+            # Extractions run in the threadpool; only the first one builds the client
+            if ocr_openai_client is None:
+                ocr_openai_client = openai.OpenAI(
+                    api_key=api_key,
+                    base_url=os.getenv("OPENAI_BASE_URL") or "https://api.openai.com/v1",
+                    http_client=httpx.Client(
+                        http2=HTTP2_AVAILABLE,
+                        timeout=httpx.Timeout(120.0, connect=10.0),
+                        limits=httpx.Limits(max_keepalive_connections=16, max_connections=32)
+                    )
+                )
+    return ocr_openai_client
+
+def _get_async_openai_client():
+    global openai_client
+    if openai_client is None:
+        api_key = os.getenv("OPENAI_API_KEY")
+        if not api_key:
+            return None
+        openai_client = openai.AsyncOpenAI(
+            api_key=api_key,
+            base_url=os.getenv("OPENAI_BASE_URL") or "https://api.openai.com/v1",
+            http_client=http_client
+        )
+    return openai_client
 
-    # Build search pattern from question configuration
-    search_label = question.search_label
-    auto_increment = question.auto_increment
+def _flush_ocr_cache(session: Session) -> None:
+    """Commit the OCR cache rows queued while scanning one PDF in a single transaction."""
+    pending = sum(1 for obj in session.new if isinstance(obj, PDFOCRCache))
+    if not pending:
+        return
+    try:
+        session.commit()
+        print(f"OCR text cached for {pending} page(s)")
+    except IntegrityError:
+        # Another request cached the same page meanwhile; its copy is just as good
+        session.rollback()
+
+@lru_cache(maxsize=2048)
+def _pdf_page_lines(path_str: str, mtime_ns: int, page_num: int) -> tuple[str, ...]:
+    # Text blocks already carry PyMuPDF's line structure; image blocks (type 1) are skipped
+    with open_pdf(Path(path_str)) as doc:
+        blocks = doc[page_num].get_text("blocks")
+    return tuple(
+        line
+        for block in blocks if block[6] == 0
+        for line in block[4].replace("\u00a0", " ").splitlines()
+    )
 
-    # Extract number from q_id if auto_increment is enabled (e.g., "Q2" -> 2)
-    question_number = None
-    if auto_increment:
-        match = re.search(r'\d+', question.q_id)
-        if match:
-            question_number = int(match.group())
+def _iter_pdf_pages(pdf_path: Path, start_page: int = 0, section_open=lambda: False):
+    """
+    Yield (page_num, native text lines) lazily so pages after the wanted section are
+    never extracted. Page lines are cached until the file is modified.
+    Pages from start_page to the end come first, then the pages before start_page.
+    If section_open() is true once those are done, a section that began before
+    start_page runs on, so start_page onwards is yielded again until the caller stops.
+    """
+    path_str, mtime_ns = str(pdf_path), pdf_path.stat().st_mtime_ns
+    with open_pdf(pdf_path) as doc:
+        page_count = doc.page_count
+    for page_num in (*range(start_page, page_count), *range(start_page)):
+        yield page_num, _pdf_page_lines(path_str, mtime_ns, page_num)
+    if start_page and section_open():
+        for page_num in range(start_page, page_count):
+            yield page_num, _pdf_page_lines(path_str, mtime_ns, page_num)
+
+@lru_cache(maxsize=256)
+def _pdf_outline(path_str: str, mtime_ns: int) -> tuple[tuple[str, int], ...]:
+    """Lowercased (title, 0-based page) of the PDF's bookmarks; empty when it has none."""
+    with open_pdf(Path(path_str)) as doc:
+        toc = doc.get_toc(simple=True)
+    return tuple(
+        (title.replace("\u00a0", " ").lower(), page - 1)
+        for _level, title, page in toc
+        if page >= 1
+    )
 
-    # Build regex patterns
+def _outline_start_page(pdf_path: Path, label_lower: str, header_re: re.Pattern) -> int:
+    """Page the bookmarks point to for the section header, or 0 to scan from the start."""
+    for title, page_num in _pdf_outline(str(pdf_path), pdf_path.stat().st_mtime_ns):
+        if label_lower in title and header_re.search(title):
+            return page_num
+    return 0
+
+@lru_cache(maxsize=256)
+def _looks_scanned(path_str: str, mtime_ns: int) -> bool:
+    """True when the leading pages have no text layer, only images (a scanned PDF)."""
+    with open_pdf(Path(path_str)) as doc:
+        sample = range(min(SCANNED_SAMPLE_PAGES, doc.page_count))
+        return bool(sample) and all(extract_page(doc, page_num)[1] for page_num in sample)
+
+# Table-of-contents dot leaders ("2. Team Management ........ 7")
+_DOT_LEADER = re.compile(r"\.{4,}")
+
+@lru_cache(maxsize=128)
+def _section_patterns(search_label: str, question_number: Optional[int]) -> tuple[re.Pattern, re.Pattern]:
+    """Compiled (header, next header) regexes for a section, built once per label/number.
+
+    Each role's variants are merged into one alternation so a line costs a single
+    regex search. Patterns are lowercase and must be searched against lowercased text.
+    """
+    label = re.escape(search_label.lower())
     header_patterns = []
     next_header_patterns = []
 
-    if auto_increment and question_number is not None:
+    if question_number is not None:
         # Pattern for current number - supports both "Label Number" and "Number Label" formats
         # Examples: "Criterion 2", "Award Criterion 2", "2. Team Management", "2 Criterion"
         header_patterns.append(
             # Label followed by Number: "Criterion 2"
-            re.compile(rf"\b(?:Award\s+)?{re.escape(search_label)}\s*{question_number}\b", re.IGNORECASE)
+            rf"\b(?:award\s+)?{label}\s*{question_number}\b"
         )
         header_patterns.append(
             # Number followed by Label: "2. Team Management" or "2 Team Management"
-            re.compile(rf"\b{question_number}\.?\s*{re.escape(search_label)}", re.IGNORECASE)
+            rf"\b{question_number}\.?\s*{label}"
         )
 
         # Pattern for next number (to detect end of section)
         next_number = question_number + 1
         next_header_patterns.append(
             # Label followed by Number: "Criterion 3"
-            re.compile(rf"\b(?:Award\s+)?{re.escape(search_label)}\s*{next_number}\b", re.IGNORECASE)
+            rf"\b(?:award\s+)?{label}\s*{next_number}\b"
         )
         next_header_patterns.append(
             # Number followed by Label: "3. Next Section" or "3 Next Section"
-            re.compile(rf"\b{next_number}\.?\s*{re.escape(search_label)}", re.IGNORECASE)
+            rf"\b{next_number}\.?\s*{label}"
         )
     else:
         # Use exact search label without numbering
-        header_patterns.append(
-            re.compile(rf"{re.escape(search_label)}", re.IGNORECASE)
-        )
+        header_patterns.append(label)
         # For non-auto-increment, we need a way to detect the next section
         # Use a generic pattern that matches common section headers (both formats)
         next_header_patterns.append(
             # Label followed by Number: "Criterion 3", "Section 4"
-            re.compile(r"^(Criterion|Section|Question|Award Criterion)\s*\d+", re.IGNORECASE)
+            r"^(criterion|section|question|award criterion)\s*\d+"
         )
         next_header_patterns.append(
             # Number followed by Label: "3. ", "4. "
-            re.compile(r"^\d+\.\s+\w", re.IGNORECASE)
+            r"^\d+\.\s+\w"
         )
 
+    def merge(patterns: list[str]) -> re.Pattern:
+        return re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
+
+    return merge(header_patterns), merge(next_header_patterns)
+
+def _extract_criterion_paragraph(pdf_path: Path, question, session: Session, applicant_id: Optional[int] = None) -> tuple[str, str] | None:
+    if not pdf_path.exists():
+        return None
+
+    # Build search pattern from question configuration
+    search_label = question.search_label
+    auto_increment = question.auto_increment
+
+    # Extract number from q_id if auto_increment is enabled (e.g., "Q2" -> 2)
+    question_number = None
+    if auto_increment:
+        match = re.search(r'\d+', question.q_id)
+        if match:
+            question_number = int(match.group())
+
+    header_re, next_header_re = _section_patterns(search_label, question_number)
+    # Cheap substring pre-check: every header alternative contains the label literally,
+    # and so do the next-header alternatives when sections are numbered
+    label_lower = search_label.lower()
+    next_needs_label = question_number is not None
+
     extracted_lines = []
     header_line = None
     collecting = False
@@ -213,79 +540,89 @@ def _extract_criterion_paragraph(pdf_path: Path, question, session: Session, app
     ocr_client = _get_openai_client()
     ocr_model = os.getenv("OPENAI_MODEL") or "gpt-4o"
 
-    with fitz.open(str(pdf_path)) as doc:
-        for page_num, page in enumerate(doc):
-            # First try standard text extraction
-            text = page.get_text("text")
+    # Without OCR a scanned PDF can only come up empty; say so before walking every page
+    if ocr_client is None and _looks_scanned(str(pdf_path), pdf_path.stat().st_mtime_ns):
+        raise HTTPException(status_code=422, detail="Scanned PDF - OCR required (OPENAI_API_KEY not configured)")
+
+    with open_pdf(pdf_path) as doc:
+        page_count = doc.page_count
+    # Bookmarks, when the PDF has them, lead straight to the section's page; the whole
+    # document is still scanned afterwards in case the outline is wrong
+    start_page = _outline_start_page(pdf_path, label_lower, header_re)
+    ocr_results = {}
+    previous_page = -1
+    try:
+        for page_num, lines in _iter_pdf_pages(pdf_path, start_page, lambda: collecting):
+            # Wrapped around to page 0 after finding the header: the section ended with the document
+            if header_line is not None and page_num < previous_page:
+                break
+            previous_page = page_num
 
             # If no text found (scanned PDF), use hybrid OCR approach
-            if not text or len(text.strip()) < 50:
-                # Check cache first
-                page_hash = get_page_hash(pdf_path, page_num)
-                cached = session.exec(select(PDFOCRCache).where(PDFOCRCache.page_hash == page_hash)).first()
-
-                if cached:
-                    print(f"Using cached OCR text for page {page_num}")
-                    text = cached.extracted_text
-                elif ocr_client:
-                    print(f"Scanned PDF detected on page {page_num}, using LLM OCR...")
-                    ocr_text, used_ocr = extract_text_hybrid(pdf_path, page_num, ocr_client, ocr_model)
-                    if used_ocr and ocr_text:
-                        text = ocr_text
-                        # Cache the OCR result
-                        cache_entry = PDFOCRCache(
-                            page_hash=page_hash,
-                            pdf_path=str(pdf_path),
-                            page_num=page_num,
-                            extracted_text=ocr_text,
-                            model_used=ocr_model,
-                            applicant_id=applicant_id
-                        )
-                        session.add(cache_entry)
-                        session.commit()
-                        print(f"OCR text cached for future use")
-                else:
-                    print(f"Warning: Scanned PDF detected but OCR not available (OpenAI provider not configured)")
-
-            if not text:
+            if sum(len(line.strip()) for line in lines) < 50:
+                if page_num not in ocr_results:
+                    # OCR this page and the following ones concurrently instead of one round trip per page.
+                    # Pages past the section are not wasted: they land in PDFOCRCache for the other questions.
+                    window = list(range(page_num, min(page_num + OCR_PREFETCH_PAGES, page_count)))
+                    ocr_results.update(extract_pages_hybrid(
+                        pdf_path, window, ocr_client, ocr_model,
+                        session=session, applicant_id=applicant_id
+                    ))
+                ocr_text, used_ocr = ocr_results.get(page_num, ("", False))
+                if used_ocr and ocr_text:
+                    lines = ocr_text.replace("\u00a0", " ").splitlines()
+
+            if not lines:
                 continue
 
-            text = text.replace("\u00a0", " ")
-            lines = text.splitlines()
+            # Match against a lowercased copy; output keeps the original case
+            lines_lower = [line.lower() for line in lines]
 
             for idx, line in enumerate(lines):
-                trimmed = line.strip()
+                trimmed = lines_lower[idx].strip()
                 if not trimmed:
                     if collecting:
                         extracted_lines.append(line)
                     continue
 
                 if collecting:
-                    # Check if any next header pattern matches
-                    if any(pattern.search(trimmed) for pattern in next_header_patterns) and not re.search(r"\.{4,}", trimmed):
+                    # Check if the next header pattern matches
+                    if (not next_needs_label or label_lower in trimmed) and next_header_re.search(trimmed) and not _DOT_LEADER.search(trimmed):
                         collecting = False
                         break
                     extracted_lines.append(line)
                     continue
 
-                # Check if any header pattern matches
-                if any(pattern.search(trimmed) for pattern in header_patterns):
-                    if re.search(r"\.{4,}", trimmed):
+                # Check if the header pattern matches
+                if label_lower in trimmed and header_re.search(trimmed):
+                    if _DOT_LEADER.search(trimmed):
                         continue
                     header_line = line
                     collecting = True
                     for j in range(idx + 1, len(lines)):
                         next_line = lines[j]
-                        next_trimmed = next_line.strip()
+                        next_trimmed = lines_lower[j].strip()
                         if not next_trimmed:
                             extracted_lines.append(next_line)
                             continue
-                        if any(pattern.search(next_trimmed) for pattern in next_header_patterns) and not re.search(r"\.{4,}", next_trimmed):
+                        if (not next_needs_label or label_lower in next_trimmed) and next_header_re.search(next_trimmed) and not _DOT_LEADER.search(next_trimmed):
                             collecting = False
                             break
                         extracted_lines.append(next_line)
                     break
 
+            # Section found and closed by the next header: later pages are irrelevant
+            if header_line is not None and not collecting:
+                if any(line.strip() for line in extracted_lines):
+                    break
+                # Closed with no body, e.g. a contents page listing "Criterion 2" right
+                # above "Criterion 3" without dot leaders: keep looking for the real section
+                header_line = None
+                extracted_lines.clear()
+    finally:
+        # Keep OCR results that were paid for even if the scan fails part-way
+        _flush_ocr_cache(session)
+
     if not extracted_lines or not header_line:
         return None
 
@@ -302,27 +639,36 @@ async def root():
     """Root endpoint"""
     return {"message": "Tender Evaluation API is running"}
 
-@app.get("/model")
-async def get_model(session: Session = Depends(get_session)):
-    """Get the configured LLM model"""
-    provider = _get_llm_provider(session)
+@lru_cache(maxsize=None)
+def _model_info(provider: str) -> dict | None:
+    """/model payload for a provider; it only depends on environment variables read at startup."""
     model_name, provider_label = _get_model_for_provider(provider)
-
     if not model_name:
-        return {"error": f"{provider_label} model not configured"}, 404
-
-    # Check if OCR is available (independent of evaluation provider)
-    ocr_available = _get_openai_client() is not None
+        return None
 
     return {
         "model": model_name,
         "provider": provider_label,
         "supports_images": provider == "openai",
-        "ocr_available": ocr_available
+        # OCR is available independently of the evaluation provider
+        "ocr_available": bool(os.getenv("OPENAI_API_KEY"))
     }
 
+@app.get("/model")
+def get_model(session: Session = Depends(get_session)):
+    """Get the configured LLM model"""
+    # The provider can be switched through /llm-config, so only it is read per request
+    provider = _get_llm_provider(session)
+    model_info = _model_info(provider)
+
+    if model_info is None:
+        _, provider_label = _get_model_for_provider(provider)
+        return {"error": f"{provider_label} model not configured"}, 404
+
+    return model_info
+
 @app.get("/llm-config")
-async def get_llm_config(session: Session = Depends(get_session)):
+def get_llm_config(session: Session = Depends(get_session)):
     """Get current LLM provider configuration"""
     provider = _get_llm_provider(session)
     model_name, provider_label = _get_model_for_provider(provider)
@@ -340,7 +686,7 @@ async def get_llm_config(session: Session = Depends(get_session)):
     }
 
 @app.put("/llm-config")
-async def update_llm_config(
+def update_llm_config(
     provider: str = Form(...),
     session: Session = Depends(get_session)
 ):
@@ -359,80 +705,214 @@ async def update_llm_config(
     session.commit()
     return {"provider": normalized}
 
-@app.post("/evaluate")
-async def evaluate_answer(
-    applicant_id: int = Form(...),
-    q_id: str = Form(...),
-    answer_text: str = Form(...),
-    image: UploadFile | None = File(None),
-    session: Session = Depends(get_session)
-):
-    """Evaluate a candidate answer using the question prompt stored in the database."""
-    provider = _get_llm_provider(session)
-    model_name, provider_label = _get_model_for_provider(provider)
-    if not model_name:
-        raise HTTPException(status_code=500, detail=f"{provider_label} model not configured")
-
-    applicant = session.get(Applicant, applicant_id)
-    if not applicant:
-        raise HTTPException(status_code=404, detail=f"Applicant {applicant_id} not found")
-
-    statement = select(Question).where(Question.q_id == q_id)
-    question = session.exec(statement).first()
-    if not question:
+# q_id lookups, built once and bound per call so SQLAlchemy reuses the compiled statement.
+# Read-only paths take plain rows, which skip ORM instance construction and the identity map.
+_QUESTION_COLUMNS = (
+    Question.id, Question.q_id, Question.prompt_json,
+    Question.is_active, Question.search_label, Question.auto_increment
+)
+_QUESTION_BY_Q_ID = select(Question).where(Question.q_id == bindparam("q_id"))
+_QUESTION_ROW_BY_Q_ID = select(*_QUESTION_COLUMNS).where(Question.q_id == bindparam("q_id"))
+_QUESTION_ID_BY_Q_ID = select(Question.id).where(Question.q_id == bindparam("q_id"))
+
+# Shape of Question.prompt_json: the fields _build_prompt() and the frontend read. Unknown keys
+# are allowed (a prompt_template may reference any of them), but at least one source of
+# question text must be present.
+_PROMPT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "question": {"type": "string"},
+        "question_text": {"type": "string"},
+        "prompt_template": {"type": "string"},
+        "scale": {"type": "string"},
+        "required_evidence": {"type": "array", "items": {"type": "string"}},
+        "evaluation_guidance": {"type": "array", "items": {"type": "string"}},
+        "output_format": {"type": "object"},
+        "weight": {"type": "number"}
+    },
+    "anyOf": [
+        {"required": ["question"]},
+        {"required": ["question_text"]},
+        {"required": ["prompt_template"]}
+    ]
+}
+# Compiled once into a specialised Python validator
+_validate_prompt = fastjsonschema.compile(_PROMPT_SCHEMA)
+
+def _parse_prompt_json(prompt_json: str) -> dict:
+    """Parse and validate a prompt_json form field; 400 when it is not a valid prompt."""
+    try:
+        prompt_data = json_utils.loads(prompt_json)
+    except json_utils.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Invalid JSON in prompt_json")
+    try:
+        _validate_prompt(prompt_data)
+    except fastjsonschema.JsonSchemaValueException as e:
+        raise HTTPException(status_code=400, detail=f"Invalid prompt_json: {e.message}")
+    return prompt_data
+
+def _prompt_dict(prompt_json) -> dict:
+    """The stored prompt as a dict; rows saved before migrate_prompt_json_objects.py hold a JSON string."""
+    return json_utils.loads(prompt_json) if isinstance(prompt_json, str) else prompt_json
+
+def _load_question_prompt(session: Session, q_id: str) -> dict:
+    """Parsed prompt_json of a question, from QUESTION_CACHE or the database on a miss."""
+    global _question_cache_expires
+    now = time.monotonic()
+    if now >= _question_cache_expires:
+        QUESTION_CACHE.clear()
+        _question_cache_expires = now + QUESTION_CACHE_TTL
+    prompt_data = QUESTION_CACHE.get(q_id)
+    if prompt_data is not None:
+        return prompt_data
+
+    statement = select(Question.prompt_json).where(Question.q_id == q_id)
+    prompt_json = session.exec(statement).first()
+    if prompt_json is None:
         raise HTTPException(status_code=404, detail=f"Question {q_id} not found")
 
     try:
-        prompt_data = json.loads(question.prompt_json)
-    except json.JSONDecodeError:
+        prompt_data = _prompt_dict(prompt_json)
+    except json_utils.JSONDecodeError:
         raise HTTPException(status_code=500, detail=f"Question {q_id} has invalid prompt_json")
+    QUESTION_CACHE[q_id] = prompt_data
+    return prompt_data
 
-    prompt = _build_prompt(prompt_data, answer_text)
-    question_text = (
-        prompt_data.get("question_text")
-        or prompt_data.get("question")
-        or ""
-    )
+def _json_response(payload) -> Response:
+    """Serialize a payload straight to JSON bytes, skipping FastAPI's jsonable_encoder pass."""
+    return Response(content=json_utils.dumps_bytes(payload), media_type="application/json")
 
-    try:
-        if provider == "openai":
-            client = _get_openai_client()
-            if not client:
-                raise HTTPException(status_code=500, detail="OPENAI_API_KEY not configured")
-
-            message_content = [{"type": "text", "text": prompt}]
-            if image:
-                allowed_types = {"image/png", "image/jpeg", "image/webp"}
-                if image.content_type not in allowed_types:
-                    raise HTTPException(status_code=400, detail="Only PNG, JPEG, or WEBP images are supported")
-                image_bytes = await image.read()
-                if not image_bytes:
-                    raise HTTPException(status_code=400, detail="Empty image upload")
-                encoded = base64.b64encode(image_bytes).decode("ascii")
-                message_content.append({
-                    "type": "image_url",
-                    "image_url": {"url": f"data:{image.content_type};base64,{encoded}"}
-                })
+def _cached_prompt_data(question: Question) -> dict:
+    """Parsed prompt_json of an already loaded question; the row wins over QUESTION_CACHE.
 
-            response = client.chat.completions.create(
+    The JSON column is already decoded on load, so the fresh row costs nothing and may
+    carry an edit this process has not seen; the cache entry is kept in step with it.
+    """
+    prompt_data = _prompt_dict(question.prompt_json)
+    QUESTION_CACHE[question.q_id] = prompt_data
+    return prompt_data
+
+def _get_eval_client(provider: str):
+    """Async client for the evaluation provider."""
+    if provider == "openai":
+        client = _get_async_openai_client()
+        if not client:
+            raise HTTPException(status_code=500, detail="OPENAI_API_KEY not configured")
+        return client
+    return eea_client
+
+async def _complete(provider: str, model_name: str, message_content) -> str:
+    """Send one user message to the configured LLM provider and return the reply text."""
+    client = _get_eval_client(provider)
+    try:
+        async with LLM_SEMAPHORE:
+            response = await client.chat.completions.create(
                 model=model_name,
                 messages=[{"role": "user", "content": message_content}],
                 temperature=0
             )
-        else:
-            if image:
-                raise HTTPException(status_code=400, detail="Image input is only supported with OpenAI")
-            response = eea_client.chat.completions.create(
-                model=model_name,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0
-            )
-    except HTTPException:
-        raise
     except Exception as e:
         raise HTTPException(status_code=502, detail=f"LLM request failed: {str(e)}")
+    return response.choices[0].message.content
 
-    content = response.choices[0].message.content
+def _response_cache_key(provider: str, model_name: str, message_content) -> str:
+    prompt = message_content if isinstance(message_content, str) else json_utils.dumps(message_content)
+    return hashlib.sha1(f"{provider}\0{model_name}\0{prompt}".encode("utf-8")).hexdigest()
+
+async def _complete_cached(session: Session, provider: str, model_name: str, message_content) -> str:
+    """_complete(), answered from LLMResponseCache when the same request was made before.
+
+    New replies are staged on the session and written by _finalize_applicant() in the
+    assessment's commit, so no write transaction is held open across LLM calls.
+    """
+    if not LLM_RESPONSE_CACHE:
+        return await _complete(provider, model_name, message_content)
+
+    key = _response_cache_key(provider, model_name, message_content)
+    cached = session.get(LLMResponseCache, key)
+    if cached is not None:
+        return cached.response
+
+    content = await _complete(provider, model_name, message_content)
+    session.info.setdefault("llm_responses", {})[key] = (model_name, content)
+    return content
+
+async def _embed_answer(provider: str, answer_text: str) -> Optional[bytes]:
+    """Packed embedding of an answer, or None when the provider cannot embed it."""
+    client = _get_eval_client(provider)
+    try:
+        async with LLM_SEMAPHORE:
+            response = await client.embeddings.create(model=EMBEDDING_MODEL, input=answer_text)
+    except Exception as e:
+        print(f"Warning: Embedding failed, semantic cache skipped: {str(e)}")
+        return None
+    return semantic_cache.pack(response.data[0].embedding)
+
+async def _complete_semantic(
+    session: Session,
+    provider: str,
+    model_name: str,
+    message_content,
+    prompt_data: dict,
+    answer_text: str
+) -> str:
+    """_complete_cached(), also answered by the reply to a near-identical earlier answer.
+
+    Only consulted when SEMANTIC_CACHE_THRESHOLD is set. New embeddings are staged on the
+    session and written with the assessment, like the replies of _complete_cached().
+    """
+    if SEMANTIC_CACHE_THRESHOLD is None or not answer_text.strip():
+        return await _complete_cached(session, provider, model_name, message_content)
+
+    # An exact repeat is answered by the response cache without an embedding call
+    if LLM_RESPONSE_CACHE:
+        cached = session.get(LLMResponseCache, _response_cache_key(provider, model_name, message_content))
+        if cached is not None:
+            return cached.response
+
+    embedding = await _embed_answer(provider, answer_text)
+    if embedding is None:
+        return await _complete_cached(session, provider, model_name, message_content)
+
+    question_key = hashlib.sha1(
+        f"{provider}\0{model_name}\0{EMBEDDING_MODEL}\0{_serialized_prompt(prompt_data)}".encode("utf-8")
+    ).hexdigest()
+    rows = session.exec(
+        select(AnswerEmbedding.embedding, AnswerEmbedding.response)
+        .where(AnswerEmbedding.question_key == question_key)
+    ).all()
+    index, similarity = semantic_cache.best_match(embedding, [row.embedding for row in rows])
+    if index >= 0 and similarity >= SEMANTIC_CACHE_THRESHOLD:
+        print(f"Semantic cache hit (similarity {similarity:.4f})")
+        return rows[index].response
+
+    content = await _complete_cached(session, provider, model_name, message_content)
+    session.info.setdefault("answer_embeddings", []).append(
+        AnswerEmbedding(question_key=question_key, embedding=embedding, response=content)
+    )
+    return content
+
+def _store_llm_responses(session: Session) -> None:
+    """Insert the replies staged by _complete_cached() and the embeddings staged by _complete_semantic().
+
+    Response keys stored meanwhile by another request are kept.
+    """
+    session.add_all(session.info.pop("answer_embeddings", []))
+    pending = session.info.pop("llm_responses", None)
+    if not pending:
+        return
+    now = datetime.utcnow()
+    session.execute(
+        sqlite_insert(LLMResponseCache)
+        .values([
+            {"key": key, "model": model_name, "response": content, "created_at": now}
+            for key, (model_name, content) in pending.items()
+        ])
+        .on_conflict_do_nothing()
+    )
+
+def _parse_assessment(content: str):
+    """Return (parsed, score, justification) from a raw LLM reply."""
     parsed = _extract_json_payload(content)
 
     # Extract score and justification from parsed result
@@ -451,6 +931,19 @@ async def evaluate_answer(
         justification_value = parsed.get("justification")
         if isinstance(justification_value, str):
             justification = justification_value
+    return parsed, score, justification
+
+def _record_assessment(
+    session: Session,
+    applicant: Applicant,
+    q_id: str,
+    question_text: str,
+    answer_text: str,
+    content: str
+):
+    """Stage the AssessmentResult for one answer; does not commit."""
+    applicant_id = applicant.id
+    parsed, score, justification = _parse_assessment(content)
 
     # Save or update assessment result in AssessmentResult table
     statement = select(AssessmentResult).where(
@@ -466,7 +959,7 @@ async def evaluate_answer(
         existing_assessment.score = score
         existing_assessment.justification = justification
         existing_assessment.llm_response = content
-        existing_assessment.parsed_result = json.dumps(parsed, ensure_ascii=True) if parsed else None
+        existing_assessment.parsed_result = json_utils.dumps(parsed) if parsed else None
         existing_assessment.created_at = datetime.utcnow()
         session.add(existing_assessment)
     else:
@@ -479,52 +972,166 @@ async def evaluate_answer(
             score=score,
             justification=justification,
             llm_response=content,
-            parsed_result=json.dumps(parsed, ensure_ascii=True) if parsed else None
+            parsed_result=json_utils.dumps(parsed) if parsed else None
         )
         session.add(new_assessment)
 
-    # Keep existing logic for backward compatibility with Applicant.evaluation_result
-    existing_result = {}
-    if applicant.evaluation_result:
-        try:
-            existing_result = json.loads(applicant.evaluation_result)
-        except json.JSONDecodeError:
-            existing_result = {}
+    return parsed
+
+def _finalize_applicant(session: Session, applicant: Applicant) -> None:
+    """Recompute the score totals and average from the assessments, then commit once.
+
+    The totals are rebuilt by one UPDATE after the staged assessments are flushed, so the
+    transaction already holds SQLite's write lock and a concurrent evaluation of the same
+    applicant cannot slip in between reading and writing them.
+    """
+    _store_llm_responses(session)
+    session.flush()
+
+    for_applicant = AssessmentResult.applicant_id == Applicant.id
+    score_sum = select(func.coalesce(func.sum(AssessmentResult.score), 0.0)).where(for_applicant).scalar_subquery()
+    score_count = select(func.count(AssessmentResult.score)).where(for_applicant).scalar_subquery()
+    statement = (
+        update(Applicant)
+        .where(Applicant.id == applicant.id)
+        .values(
+            score_sum=score_sum,
+            score_count=score_count,
+            evaluation_score=score_sum / func.nullif(score_count, 0),
+            status="completed",
+            processed_at=datetime.utcnow()
+        )
+        .returning(
+            Applicant.score_sum, Applicant.score_count, Applicant.evaluation_score,
+            Applicant.status, Applicant.processed_at
+        )
+        .execution_options(synchronize_session=False)
+    )
+    row = session.exec(statement).one()
+    session.commit()
 
-    evaluations = existing_result.get("evaluations")
-    if not isinstance(evaluations, dict):
-        evaluations = {}
+    # Mirror the stored values on the loaded object without marking it dirty. RETURNING hands
+    # back whole-number REAL values as ints, so restore the float type of the score columns.
+    set_committed_value(applicant, "score_sum", float(row.score_sum))
+    set_committed_value(applicant, "score_count", row.score_count)
+    set_committed_value(
+        applicant, "evaluation_score",
+        float(row.evaluation_score) if row.evaluation_score is not None else None
+    )
+    set_committed_value(applicant, "status", row.status)
+    set_committed_value(applicant, "processed_at", row.processed_at)
+
+async def _evaluate_many(
+    session: Session,
+    applicant: Applicant,
+    provider: str,
+    model_name: str,
+    prompts: dict,
+    items: list[dict]
+) -> dict:
+    """Run the LLM calls for all items concurrently, then store every result in one commit.
+
+    A failed call is reported as the item's "error" and does not discard the completions
+    that succeeded; only when every call fails is the first error raised.
+    """
+    contents = await asyncio.gather(*(
+        _complete_semantic(
+            session, provider, model_name,
+            _build_prompt(prompts[item["q_id"]], item["answer_text"]),
+            prompts[item["q_id"]], item["answer_text"]
+        )
+        for item in items
+    ), return_exceptions=True)
+
+    failures = [content for content in contents if isinstance(content, BaseException)]
+    for failure in failures:
+        # Cancellation and the like must still propagate
+        if not isinstance(failure, Exception):
+            raise failure
+    if len(failures) == len(contents):
+        raise failures[0]
+
+    results = []
+    for item, content in zip(items, contents):
+        q_id, answer_text = item["q_id"], item["answer_text"]
+        if isinstance(content, Exception):
+            detail = content.detail if isinstance(content, HTTPException) else str(content)
+            print(f"Evaluation of {q_id} for applicant {applicant.id} failed: {detail}")
+            results.append({"q_id": q_id, "answer_text": answer_text, "error": detail})
+            continue
+
+        prompt_data = prompts[q_id]
+        question_text = prompt_data.get("question_text") or prompt_data.get("question") or ""
+
+        parsed = _record_assessment(session, applicant, q_id, question_text, answer_text, content)
+        results.append({
+            "q_id": q_id,
+            "answer_text": answer_text,
+            "llm_response": content,
+            "parsed_result": parsed
+        })
 
-    evaluations[q_id] = {
-        "question_text": question_text,
-        "answer_text": answer_text,
-        "parsed_result": parsed,
-        "llm_response": content
+    _finalize_applicant(session, applicant)
+
+    return {
+        "applicant_id": applicant.id,
+        "results": results,
+        "evaluation_score": applicant.evaluation_score
     }
 
-    existing_result["evaluations"] = evaluations
-    existing_result["last_updated"] = datetime.utcnow().isoformat()
+@app.post("/evaluate")
+async def evaluate_answer(
+    applicant_id: int = Form(...),
+    q_id: str = Form(...),
+    answer_text: str = Form(...),
+    image: UploadFile | None = File(None),
+    session: Session = Depends(get_session)
+):
+    """Evaluate a candidate answer using the question prompt stored in the database."""
+    provider = _get_llm_provider(session)
+    model_name, provider_label = _get_model_for_provider(provider)
+    if not model_name:
+        raise HTTPException(status_code=500, detail=f"{provider_label} model not configured")
 
-    # Calculate average score from all assessments
-    all_assessments = session.exec(
-        select(AssessmentResult).where(AssessmentResult.applicant_id == applicant_id)
-    ).all()
+    applicant = session.get(Applicant, applicant_id)
+    if not applicant:
+        raise HTTPException(status_code=404, detail=f"Applicant {applicant_id} not found")
 
-    scores = []
-    for assessment in all_assessments:
-        if assessment.score is not None:
-            scores.append(assessment.score)
-        # If this is the current assessment being created and hasn't been committed yet
-        elif assessment.q_id == q_id and score is not None:
-            scores.append(score)
-
-    applicant.evaluation_score = (sum(scores) / len(scores)) if scores else None
-    applicant.evaluation_result = json.dumps(existing_result, ensure_ascii=True)
-    applicant.status = "completed"
-    applicant.processed_at = datetime.utcnow()
-    session.add(applicant)
-    session.commit()
-    session.refresh(applicant)
+    prompt_data = _load_question_prompt(session, q_id)
+
+    prompt = _build_prompt(prompt_data, answer_text)
+    question_text = (
+        prompt_data.get("question_text")
+        or prompt_data.get("question")
+        or ""
+    )
+
+    if provider == "openai":
+        message_content = [{"type": "text", "text": prompt}]
+        if image:
+            allowed_types = {"image/png", "image/jpeg", "image/webp"}
+            if image.content_type not in allowed_types:
+                raise HTTPException(status_code=400, detail="Only PNG, JPEG, or WEBP images are supported")
+            image_bytes = await image.read()
+            if not image_bytes:
+                raise HTTPException(status_code=400, detail="Empty image upload")
+            encoded = base64.b64encode(image_bytes).decode("ascii")
+            message_content.append({
+                "type": "image_url",
+                "image_url": {"url": f"data:{image.content_type};base64,{encoded}"}
+            })
+    else:
+        if image:
+            raise HTTPException(status_code=400, detail="Image input is only supported with OpenAI")
+        message_content = prompt
+
+    if image:
+        content = await _complete_cached(session, provider, model_name, message_content)
+    else:
+        content = await _complete_semantic(session, provider, model_name, message_content, prompt_data, answer_text)
+
+    parsed = _record_assessment(session, applicant, q_id, question_text, answer_text, content)
+    _finalize_applicant(session, applicant)
 
     return {
         "applicant_id": applicant_id,
@@ -533,10 +1140,241 @@ async def evaluate_answer(
         "answer_text": answer_text,
         "llm_response": content,
         "parsed_result": parsed,
-        "evaluation_result": existing_result,
         "evaluation_score": applicant.evaluation_score
     }
 
+@app.post("/evaluate-batch")
+async def evaluate_answers_batch(
+    applicant_id: int = Form(...),
+    answers: str = Form(...),
+    session: Session = Depends(get_session)
+):
+    """
+    Evaluate several answers for one applicant and store all results in a single commit.
+    `answers` is a JSON list of {"q_id": ..., "answer_text": ...} objects.
+    """
+    try:
+        items = json_utils.loads(answers)
+    except json_utils.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Invalid JSON in answers")
+    if not isinstance(items, list) or not all(
+        isinstance(item, dict)
+        and isinstance(item.get("q_id"), str)
+        and isinstance(item.get("answer_text"), str)
+        for item in items
+    ):
+        raise HTTPException(status_code=400, detail="answers must be a list of {q_id, answer_text} objects")
+
+    provider = _get_llm_provider(session)
+    model_name, provider_label = _get_model_for_provider(provider)
+    if not model_name:
+        raise HTTPException(status_code=500, detail=f"{provider_label} model not configured")
+
+    applicant = session.get(Applicant, applicant_id)
+    if not applicant:
+        raise HTTPException(status_code=404, detail=f"Applicant {applicant_id} not found")
+
+    # Resolve every prompt before spending any LLM calls
+    prompts = {}
+    for item in items:
+        q_id = item["q_id"]
+        if q_id not in prompts:
+            prompts[q_id] = _load_question_prompt(session, q_id)
+
+    return await _evaluate_many(session, applicant, provider, model_name, prompts, items)
+
+@app.post("/evaluate-all")
+async def evaluate_all_answers(
+    applicant_id: int = Form(...),
+    session: Session = Depends(get_session)
+):
+    """Evaluate the saved answers of an applicant against every active question."""
+    provider = _get_llm_provider(session)
+    model_name, provider_label = _get_model_for_provider(provider)
+    if not model_name:
+        raise HTTPException(status_code=500, detail=f"{provider_label} model not configured")
+
+    applicant = session.get(Applicant, applicant_id)
+    if not applicant:
+        raise HTTPException(status_code=404, detail=f"Applicant {applicant_id} not found")
+
+    q_ids = session.exec(select(Question.q_id).where(Question.is_active == True)).all()
+    answers = {
+        answer.q_id: answer.answer_text
+        for answer in session.exec(
+            select(ApplicantAnswer).where(ApplicantAnswer.applicant_id == applicant_id)
+        ).all()
+    }
+
+    prompts = {}
+    items = []
+    skipped = []
+    for q_id in q_ids:
+        answer_text = answers.get(q_id)
+        if not answer_text:
+            skipped.append(q_id)
+            continue
+        prompts[q_id] = _load_question_prompt(session, q_id)
+        items.append({"q_id": q_id, "answer_text": answer_text})
+
+    if not items:
+        raise HTTPException(status_code=404, detail=f"No saved answers to evaluate for applicant {applicant_id}")
+
+    result = await _evaluate_many(session, applicant, provider, model_name, prompts, items)
+    result["skipped"] = skipped
+    return result
+
+@app.post("/evaluate-all/batch")
+async def submit_evaluation_batch(
+    applicant_ids: Optional[List[int]] = Form(None),
+    session: Session = Depends(get_session)
+):
+    """Submit every saved answer that has no assessment yet as one Batch API job.
+
+    Covers all applicants unless applicant_ids is given. Results are ingested
+    by polling /batch-status/{batch_id}.
+    """
+    provider = _get_llm_provider(session)
+    model_name, provider_label = _get_model_for_provider(provider)
+    if not model_name:
+        raise HTTPException(status_code=500, detail=f"{provider_label} model not configured")
+    client = _get_eval_client(provider)
+
+    # Saved answers to active questions without an AssessmentResult
+    statement = (
+        select(ApplicantAnswer.applicant_id, ApplicantAnswer.q_id, ApplicantAnswer.answer_text)
+        .join(Question, Question.q_id == ApplicantAnswer.q_id)
+        .outerjoin(
+            AssessmentResult,
+            (AssessmentResult.applicant_id == ApplicantAnswer.applicant_id)
+            & (AssessmentResult.q_id == ApplicantAnswer.q_id)
+        )
+        .where(Question.is_active == True, AssessmentResult.id == None)
+    )
+    if applicant_ids:
+        statement = statement.where(ApplicantAnswer.applicant_id.in_(applicant_ids))
+    pending = [row for row in session.exec(statement).all() if row.answer_text]
+    if not pending:
+        raise HTTPException(status_code=404, detail="No unevaluated answers to submit")
+
+    batch_file = batch_eval.build_batch_file(model_name, (
+        (batch_eval.make_custom_id(applicant_id, q_id, answer_text), _build_prompt(_load_question_prompt(session, q_id), answer_text))
+        for applicant_id, q_id, answer_text in pending
+    ))
+
+    try:
+        input_file = await client.files.create(file=("evaluations.jsonl", batch_file), purpose="batch")
+        batch = await client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=batch_eval.BATCH_ENDPOINT,
+            completion_window=batch_eval.BATCH_COMPLETION_WINDOW
+        )
+    except Exception as e:
+        raise HTTPException(status_code=502, detail=f"Batch submission failed: {str(e)}")
+
+    submitted_ids = {applicant_id for applicant_id, _, _ in pending}
+    for applicant in session.exec(select(Applicant).where(Applicant.id.in_(submitted_ids))).all():
+        applicant.status = "processing"
+        session.add(applicant)
+    session.commit()
+
+    return {
+        "batch_id": batch.id,
+        "status": batch.status,
+        "requests": len(pending),
+        "applicant_ids": sorted(submitted_ids)
+    }
+
+@app.get("/batch-status/{batch_id}")
+async def get_evaluation_batch(batch_id: str, session: Session = Depends(get_session)):
+    """Report a Batch API job; once completed, store its results like /evaluate does.
+
+    A completed batch is ingested once. Replies are skipped when the answer was edited
+    after submission or has been evaluated again since.
+    """
+    client = _get_eval_client(_get_llm_provider(session))
+    try:
+        batch = await client.batches.retrieve(batch_id)
+    except Exception as e:
+        raise HTTPException(status_code=502, detail=f"Batch lookup failed: {str(e)}")
+
+    result = {
+        "batch_id": batch.id,
+        "status": batch.status,
+        "request_counts": batch.request_counts.model_dump() if batch.request_counts else None
+    }
+    if batch.status != "completed":
+        return result
+
+    # Claim the batch inside the ingest transaction; the claim holds SQLite's write lock, so a
+    # concurrent poll waits and then finds the batch taken
+    claim = session.execute(
+        sqlite_insert(EvaluationBatch).values(batch_id=batch.id, ingested_at=datetime.utcnow()).on_conflict_do_nothing()
+    )
+    if claim.rowcount == 0:
+        session.rollback()
+        result["ingested"] = 0
+        result["already_ingested"] = True
+        return result
+
+    replies, errors = {}, {}
+    try:
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if file_id:
+                file_content = await client.files.content(file_id)
+                file_replies, file_errors = batch_eval.parse_batch_output(file_content.content)
+                replies.update(file_replies)
+                errors.update(file_errors)
+    except Exception as e:
+        session.rollback()  # Release the claim so the next poll retries
+        raise HTTPException(status_code=502, detail=f"Batch lookup failed: {str(e)}")
+
+    by_applicant: dict[int, list[tuple[str, str, Optional[str], str]]] = {}
+    for custom_id, content in replies.items():
+        applicant_id, q_id, digest = batch_eval.split_custom_id(custom_id)
+        by_applicant.setdefault(applicant_id, []).append((custom_id, q_id, digest, content))
+
+    submitted_at = datetime.utcfromtimestamp(batch.created_at)
+    ingested = 0
+    skipped = {}
+    for applicant_id, entries in by_applicant.items():
+        applicant = session.get(Applicant, applicant_id)
+        if not applicant:
+            continue  # Deleted while the batch was running
+        answers = dict(session.exec(
+            select(ApplicantAnswer.q_id, ApplicantAnswer.answer_text).where(ApplicantAnswer.applicant_id == applicant_id)
+        ).all())
+        assessed_at = dict(session.exec(
+            select(AssessmentResult.q_id, AssessmentResult.created_at).where(AssessmentResult.applicant_id == applicant_id)
+        ).all())
+
+        for custom_id, q_id, digest, content in entries:
+            answer_text = answers.get(q_id)
+            if answer_text is None:
+                skipped[custom_id] = "Answer deleted since submission"
+                continue
+            if digest is not None and batch_eval.answer_digest(answer_text) != digest:
+                skipped[custom_id] = "Answer changed since submission"
+                continue
+            if q_id in assessed_at and assessed_at[q_id] >= submitted_at:
+                skipped[custom_id] = "Evaluated again since submission"
+                continue
+            try:
+                prompt_data = _load_question_prompt(session, q_id)
+            except HTTPException:
+                continue  # Question deleted meanwhile
+            question_text = prompt_data.get("question_text") or prompt_data.get("question") or ""
+            _record_assessment(session, applicant, q_id, question_text, answer_text, content)
+            ingested += 1
+        _finalize_applicant(session, applicant)
+    # Commits the claim when no applicant was left to finalize
+    session.commit()
+
+    result["ingested"] = ingested
+    result["skipped"] = skipped
+    result["errors"] = errors
+    return result
+
 @app.post("/extract-answer")
 async def extract_answer_paragraph(
     applicant_id: int = Form(...),
@@ -549,8 +1387,7 @@ async def extract_answer_paragraph(
         raise HTTPException(status_code=404, detail=f"Applicant {applicant_id} not found")
 
     # Get question to retrieve search configuration
-    statement = select(Question).where(Question.q_id == q_id)
-    question = session.exec(statement).first()
+    question = session.exec(_QUESTION_ROW_BY_Q_ID, params={"q_id": q_id}).first()
     if not question:
         raise HTTPException(status_code=404, detail=f"Question {q_id} not found")
 
@@ -558,7 +1395,8 @@ async def extract_answer_paragraph(
     if not file_path.is_absolute():
         file_path = Path(__file__).resolve().parent / file_path
 
-    extracted = _extract_criterion_paragraph(file_path, question, session, applicant_id)
+    # PyMuPDF parsing and OCR of scanned pages are blocking; keep them off the event loop
+    extracted = await run_in_threadpool(_extract_criterion_paragraph, file_path, question, session, applicant_id)
     if not extracted:
         search_pattern = question.search_label
         if question.auto_increment:
@@ -582,7 +1420,7 @@ async def extract_answer_paragraph(
     }
 
 @app.get("/applicant-answer/{applicant_id}/{q_id}")
-async def get_applicant_answer(
+def get_applicant_answer(
     applicant_id: int,
     q_id: str,
     session: Session = Depends(get_session)
@@ -610,7 +1448,7 @@ async def get_applicant_answer(
     }
 
 @app.post("/applicant-answer")
-async def save_applicant_answer(
+def save_applicant_answer(
     applicant_id: int = Form(...),
     q_id: str = Form(...),
     answer_text: str = Form(...),
@@ -618,61 +1456,43 @@ async def save_applicant_answer(
     session: Session = Depends(get_session)
 ):
     """Save or update an applicant's answer to a question"""
-    # Check if answer already exists
-    statement = select(ApplicantAnswer).where(
-        ApplicantAnswer.applicant_id == applicant_id,
-        ApplicantAnswer.q_id == q_id
-    )
-    existing_answer = session.exec(statement).first()
-
-    if existing_answer:
-        # Update existing answer
-        existing_answer.answer_text = answer_text
-        existing_answer.source = source
-        existing_answer.updated_at = datetime.utcnow()
-        session.add(existing_answer)
-        session.commit()
-        session.refresh(existing_answer)
-
-        return {
-            "message": "Answer updated successfully",
-            "answer": {
-                "id": existing_answer.id,
-                "applicant_id": existing_answer.applicant_id,
-                "q_id": existing_answer.q_id,
-                "answer_text": existing_answer.answer_text,
-                "source": existing_answer.source,
-                "created_at": existing_answer.created_at.isoformat(),
-                "updated_at": existing_answer.updated_at.isoformat()
-            }
-        }
-    else:
-        # Create new answer
-        new_answer = ApplicantAnswer(
+    # Single-statement UPSERT on the (applicant_id, q_id) unique index
+    now = datetime.utcnow()
+    statement = (
+        sqlite_insert(ApplicantAnswer)
+        .values(
             applicant_id=applicant_id,
             q_id=q_id,
             answer_text=answer_text,
-            source=source
+            source=source,
+            created_at=now,
+            updated_at=now
         )
-        session.add(new_answer)
-        session.commit()
-        session.refresh(new_answer)
+        .on_conflict_do_update(
+            index_elements=["applicant_id", "q_id"],
+            set_={"answer_text": answer_text, "source": source, "updated_at": now}
+        )
+        .returning(ApplicantAnswer.id, ApplicantAnswer.created_at)
+    )
+    answer_id, created_at = session.execute(statement).one()
+    session.commit()
 
-        return {
-            "message": "Answer saved successfully",
-            "answer": {
-                "id": new_answer.id,
-                "applicant_id": new_answer.applicant_id,
-                "q_id": new_answer.q_id,
-                "answer_text": new_answer.answer_text,
-                "source": new_answer.source,
-                "created_at": new_answer.created_at.isoformat(),
-                "updated_at": new_answer.updated_at.isoformat()
-            }
+    return {
+        # An update keeps the original created_at
+        "message": "Answer saved successfully" if created_at == now else "Answer updated successfully",
+        "answer": {
+            "id": answer_id,
+            "applicant_id": applicant_id,
+            "q_id": q_id,
+            "answer_text": answer_text,
+            "source": source,
+            "created_at": created_at.isoformat(),
+            "updated_at": now.isoformat()
         }
+    }
 
 @app.get("/assessment-results/{applicant_id}")
-async def get_assessment_results(
+def get_assessment_results(
     applicant_id: int,
     session: Session = Depends(get_session)
 ):
@@ -688,8 +1508,8 @@ async def get_assessment_results(
         parsed_obj = None
         if result.parsed_result:
             try:
-                parsed_obj = json.loads(result.parsed_result)
-            except json.JSONDecodeError:
+                parsed_obj = json_utils.loads(result.parsed_result)
+            except json_utils.JSONDecodeError:
                 parsed_obj = None
 
         assessment_list.append({
@@ -708,88 +1528,191 @@ async def get_assessment_results(
     return {"results": assessment_list}
 
 @app.get("/uploads")
-async def list_uploads(session: Session = Depends(get_session)):
-    """List all uploaded PDF files from database"""
+def list_uploads(
+    limit: Optional[int] = Query(None, ge=1),
+    offset: int = Query(0, ge=0),
+    session: Session = Depends(get_session)
+):
+    """List uploaded PDF files from database (newest first, optionally paginated)"""
     try:
-        statement = select(Applicant).order_by(Applicant.uploaded_at.desc())
-        applicants = session.exec(statement).all()
-
-        uploads = []
-        for applicant in applicants:
-            evaluation_payload = None
-            if applicant.evaluation_result:
-                try:
-                    evaluation_payload = json.loads(applicant.evaluation_result)
-                except json.JSONDecodeError:
-                    evaluation_payload = None
-
-            uploads.append({
-                "id": applicant.id,
-                "filename": applicant.filename,
-                "vendor_name": applicant.vendor_name,
-                "file_size": applicant.file_size,
-                "uploaded_at": applicant.uploaded_at.timestamp(),
-                "status": applicant.status,
-                "evaluation_score": applicant.evaluation_score,
-                "evaluation_result": evaluation_payload
-            })
+        # Only the list columns; the evaluation_result blob is served by /uploads/{id}
+        statement = select(
+            Applicant.id,
+            Applicant.filename,
+            Applicant.vendor_name,
+            Applicant.file_size,
+            Applicant.uploaded_at,
+            Applicant.status,
+            Applicant.evaluation_score
+        ).order_by(Applicant.uploaded_at.desc()).offset(offset)
+        if limit is not None:
+            statement = statement.limit(limit)
+        rows = session.exec(statement).all()
+
+        uploads = [
+            {
+                "id": row.id,
+                "filename": row.filename,
+                "vendor_name": row.vendor_name,
+                "file_size": row.file_size,
+                "uploaded_at": row.uploaded_at.timestamp(),
+                "status": row.status,
+                "evaluation_score": row.evaluation_score
+            }
+            for row in rows
+        ]
 
         return {"uploads": uploads}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to list uploads: {str(e)}")
 
-@app.post("/upload")
-async def upload_pdf(
-    file: UploadFile = File(...),
-    vendor_name: str = Form(...),
-    session: Session = Depends(get_session)
-):
-    """Upload a PDF file and save it with the vendor name"""
+@app.get("/uploads/{applicant_id}")
+def get_upload(applicant_id: int, session: Session = Depends(get_session)):
+    """Get one uploaded PDF including its detailed evaluation result"""
+    applicant = session.get(Applicant, applicant_id)
+    if not applicant:
+        raise HTTPException(status_code=404, detail=f"Applicant {applicant_id} not found")
 
-    # Validate file type
-    if not file.filename.endswith('.pdf'):
-        raise HTTPException(status_code=400, detail="Only PDF files are allowed")
+    # Assembled from AssessmentResult, the single store of per-question evaluations
+    rows = session.exec(
+        select(
+            AssessmentResult.q_id,
+            AssessmentResult.question_text,
+            AssessmentResult.answer_text,
+            AssessmentResult.parsed_result,
+            AssessmentResult.llm_response
+        ).where(AssessmentResult.applicant_id == applicant_id)
+    ).all()
+    evaluation_result = None
+    if rows:
+        evaluations = {}
+        for row in rows:
+            try:
+                parsed = json_utils.loads(row.parsed_result) if row.parsed_result else None
+            except json_utils.JSONDecodeError:
+                parsed = None
+            evaluations[row.q_id] = {
+                "question_text": row.question_text,
+                "answer_text": row.answer_text,
+                "parsed_result": parsed,
+                "llm_response": row.llm_response
+            }
+        evaluation_result = {
+            "evaluations": evaluations,
+            "last_updated": applicant.processed_at.isoformat() if applicant.processed_at else None
+        }
 
-    # Sanitize vendor name for file system
-    safe_vendor_name = "".join(c for c in vendor_name if c.isalnum() or c in (' ', '-', '_')).strip()
+    return {
+        "id": applicant.id,
+        "filename": applicant.filename,
+        "vendor_name": applicant.vendor_name,
+        "file_size": applicant.file_size,
+        "uploaded_at": applicant.uploaded_at.timestamp(),
+        "status": applicant.status,
+        "evaluation_score": applicant.evaluation_score,
+        "evaluation_result": evaluation_result
+    }
+
+def _persist(session: Session, instance) -> None:
+    session.add(instance)
+    session.commit()
+
+def _persist_all(session: Session, instances: list) -> list[int]:
+    """Insert all rows in one transaction (a single fsync on SQLite) and return their ids."""
+    with session.begin():
+        session.add_all(instances)
+        session.flush()
+        return [instance.id for instance in instances]
+
+def _has_pdf_extension(filename: Optional[str]) -> bool:
+    # Starlette may hand over a missing filename; Windows clients often send ".PDF"
+    return (filename or "").lower().endswith(PDF_EXTENSIONS)
+
+def _safe_vendor_name(vendor_name: str) -> str:
+    """Sanitize a vendor name for use as a file name"""
+    safe_vendor_name = _UNSAFE_VENDOR_CHARS.sub("", vendor_name).strip()
     if not safe_vendor_name:
         raise HTTPException(status_code=400, detail="Invalid vendor name")
+    return safe_vendor_name
+
+async def _read_chunks(file: UploadFile) -> AsyncIterator[bytes]:
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        yield chunk
+
+async def _save_upload(chunks: AsyncIterator[bytes], safe_vendor_name: str) -> tuple[str, Path, int]:
+    """Stream an upload to UPLOAD_DIR and return (filename, file_path, file_size)"""
+    # Check the PDF signature before creating anything on disk
+    chunks = chunks.__aiter__()
+    head = b""
+    async for chunk in chunks:
+        head += chunk
+        if len(head) >= PDF_MAGIC_WINDOW:
+            break
+    if PDF_MAGIC not in head[:PDF_MAGIC_WINDOW]:
+        raise HTTPException(status_code=400, detail="Only PDF files are allowed")
+    if len(head) > MAX_UPLOAD_BYTES:
+        raise HTTPException(status_code=413, detail=f"File too large (limit {MAX_UPLOAD_BYTES // (1024 * 1024)} MB)")
 
     # Create filename with vendor name
     file_extension = ".pdf"
     filename = f"{safe_vendor_name}{file_extension}"
     file_path = UPLOAD_DIR / filename
 
-    # If file exists, add a number suffix
-    counter = 1
-    while file_path.exists():
-        filename = f"{safe_vendor_name}_{counter}{file_extension}"
-        file_path = UPLOAD_DIR / filename
-        counter += 1
-
-    # Save the file
-    try:
-        with file_path.open("wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to save file: {str(e)}")
-
-    # Save to database
+    # Save the file, streaming it in chunks without blocking the event loop.
+    # The semaphore caps how many uploads hold open files and spool data at once.
+    async with UPLOAD_SEMAPHORE:
+        try:
+            # "xb" is O_CREAT|O_EXCL: checking and claiming the name is a single atomic open
+            while True:
+                try:
+                    out = await aiofiles.open(file_path, "xb")
+                    break
+                except FileExistsError:
+                    # Name taken: a random suffix avoids probing the directory for a free number
+                    filename = f"{safe_vendor_name}_{uuid.uuid4().hex[:8]}{file_extension}"
+                    file_path = UPLOAD_DIR / filename
+            file_size = 0
+            completed = False
+            try:
+                await out.write(head)
+                file_size += len(head)
+                async for chunk in chunks:
+                    file_size += len(chunk)
+                    if file_size > MAX_UPLOAD_BYTES:
+                        raise HTTPException(
+                            status_code=413,
+                            detail=f"File too large (limit {MAX_UPLOAD_BYTES // (1024 * 1024)} MB)"
+                        )
+                    await out.write(chunk)
+                completed = True
+            finally:
+                await out.close()
+                if not completed:
+                    # Don't leave a partial file behind
+                    file_path.unlink(missing_ok=True)
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Failed to save file: {str(e)}")
+
+    return filename, file_path, file_size
+
+async def _register_upload(session: Session, vendor_name: str, filename: str, file_path: Path, file_size: int) -> dict:
+    """Insert the Applicant row for a saved upload; the file is removed if that fails"""
     try:
         applicant = Applicant(
             vendor_name=vendor_name,
             filename=filename,
             file_path=str(file_path),
-            file_size=file_path.stat().st_size,
+            file_size=file_size,
             status="uploaded"
         )
-        session.add(applicant)
-        session.commit()
-        session.refresh(applicant)
-    except Exception as e:
-        # If database save fails, delete the uploaded file
-        if file_path.exists():
-            file_path.unlink()
+        # The commit blocks on SQLite I/O; keep it off the event loop
+        await run_in_threadpool(_persist, session, applicant)
+    except SQLAlchemyError as e:
+        # Leave the session (and its pooled connection) usable, then drop the orphaned file
+        session.rollback()
+        file_path.unlink(missing_ok=True)
         raise HTTPException(status_code=500, detail=f"Failed to save to database: {str(e)}")
 
     return {
@@ -801,8 +1724,109 @@ async def upload_pdf(
         "file_size": applicant.file_size
     }
 
+@app.post("/upload")
+async def upload_pdf(
+    file: UploadFile = File(...),
+    vendor_name: str = Form(...),
+    session: Session = Depends(get_session)
+):
+    """Upload a PDF file and save it with the vendor name"""
+
+    # Validate file type
+    if not _has_pdf_extension(file.filename):
+        raise HTTPException(status_code=400, detail="Only PDF files are allowed")
+
+    safe_vendor_name = _safe_vendor_name(vendor_name)
+    filename, file_path, file_size = await _save_upload(_read_chunks(file), safe_vendor_name)
+    return await _register_upload(session, vendor_name, filename, file_path, file_size)
+
+@app.post("/upload/stream")
+async def upload_pdf_stream(
+    request: Request,
+    vendor_name: str = Query(...),
+    session: Session = Depends(get_session)
+):
+    """Upload a PDF sent as the raw request body (Content-Type: application/pdf).
+
+    The body is written to disk as it arrives, without the multipart parsing
+    and temporary spool file that /upload goes through.
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if content_type != "application/pdf":
+        raise HTTPException(status_code=415, detail="Send the PDF as the request body with Content-Type: application/pdf")
+
+    safe_vendor_name = _safe_vendor_name(vendor_name)
+    filename, file_path, file_size = await _save_upload(request.stream(), safe_vendor_name)
+    return await _register_upload(session, vendor_name, filename, file_path, file_size)
+
+@app.post("/upload/bulk")
+async def upload_pdfs(
+    files: List[UploadFile] = File(...),
+    vendor_names: Optional[List[str]] = Form(None),
+    session: Session = Depends(get_session)
+):
+    """Upload several PDF files at once and register them in a single transaction.
+
+    vendor_names is matched to files by position; when omitted, each vendor
+    name is taken from the file name.
+    """
+    # Validate everything before writing anything to disk
+    for file in files:
+        if not _has_pdf_extension(file.filename):
+            raise HTTPException(status_code=400, detail=f"Only PDF files are allowed: {file.filename}")
+
+    if vendor_names is None:
+        vendor_names = [Path(file.filename).stem for file in files]
+    elif len(vendor_names) != len(files):
+        raise HTTPException(status_code=400, detail="vendor_names must have one entry per file")
+    safe_vendor_names = [_safe_vendor_name(vendor_name) for vendor_name in vendor_names]
+
+    saved = await asyncio.gather(
+        *(_save_upload(_read_chunks(file), safe_name) for file, safe_name in zip(files, safe_vendor_names)),
+        return_exceptions=True
+    )
+    written = [result[1] for result in saved if not isinstance(result, BaseException)]
+    failure = next((result for result in saved if isinstance(result, BaseException)), None)
+    if failure is not None:
+        for file_path in written:
+            file_path.unlink(missing_ok=True)
+        raise failure
+
+    applicants = [
+        Applicant(
+            vendor_name=vendor_name,
+            filename=filename,
+            file_path=str(file_path),
+            file_size=file_size,
+            status="uploaded"
+        )
+        for vendor_name, (filename, file_path, file_size) in zip(vendor_names, saved)
+    ]
+
+    try:
+        ids = await run_in_threadpool(_persist_all, session, applicants)
+    except SQLAlchemyError as e:
+        # session.begin() has already rolled the transaction back
+        for file_path in written:
+            file_path.unlink(missing_ok=True)
+        raise HTTPException(status_code=500, detail=f"Failed to save to database: {str(e)}")
+
+    return {
+        "message": f"{len(applicants)} files uploaded successfully",
+        "uploads": [
+            {
+                "id": applicant_id,
+                "vendor_name": vendor_name,
+                "filename": filename,
+                "file_path": str(file_path),
+                "file_size": file_size
+            }
+            for applicant_id, vendor_name, (filename, file_path, file_size) in zip(ids, vendor_names, saved)
+        ]
+    }
+
 @app.delete("/uploads/{applicant_id}")
-async def delete_applicant(applicant_id: int, session: Session = Depends(get_session)):
+def delete_applicant(applicant_id: int, session: Session = Depends(get_session)):
     """Delete an applicant and their uploaded file"""
     try:
         # Find the applicant
@@ -833,10 +1857,10 @@ async def delete_applicant(applicant_id: int, session: Session = Depends(get_ses
         raise HTTPException(status_code=500, detail=f"Failed to delete applicant: {str(e)}")
 
 @app.get("/questions")
-async def list_questions(session: Session = Depends(get_session)):
+def list_questions(session: Session = Depends(get_session)):
     """List all evaluation questions"""
     try:
-        statement = select(Question).where(Question.is_active == True).order_by(Question.q_id)
+        statement = select(*_QUESTION_COLUMNS).where(Question.is_active == True).order_by(Question.q_id)
         questions = session.exec(statement).all()
 
         result = []
@@ -844,41 +1868,40 @@ async def list_questions(session: Session = Depends(get_session)):
             result.append({
                 "id": q.id,
                 "q_id": q.q_id,
-                "prompt_json": json.loads(q.prompt_json),
+                "prompt_json": _cached_prompt_data(q),
                 "is_active": q.is_active,
                 "search_label": q.search_label,
                 "auto_increment": q.auto_increment
             })
 
-        return {"questions": result}
+        return _json_response({"questions": result})
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to list questions: {str(e)}")
 
 @app.get("/questions/{q_id}")
-async def get_question(q_id: str, session: Session = Depends(get_session)):
+def get_question(q_id: str, session: Session = Depends(get_session)):
     """Get a specific question by q_id"""
     try:
-        statement = select(Question).where(Question.q_id == q_id)
-        question = session.exec(statement).first()
+        question = session.exec(_QUESTION_ROW_BY_Q_ID, params={"q_id": q_id}).first()
 
         if not question:
             raise HTTPException(status_code=404, detail=f"Question {q_id} not found")
 
-        return {
+        return _json_response({
             "id": question.id,
             "q_id": question.q_id,
-            "prompt_json": json.loads(question.prompt_json),
+            "prompt_json": _cached_prompt_data(question),
             "is_active": question.is_active,
             "search_label": question.search_label,
             "auto_increment": question.auto_increment
-        }
+        })
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get question: {str(e)}")
 
 @app.post("/questions")
-async def create_question(
+def create_question(
     q_id: str = Form(...),
     prompt_json: str = Form(...),
     is_active: bool = Form(True),
@@ -888,46 +1911,41 @@ async def create_question(
 ):
     """Create a new evaluation question"""
     try:
-        # Validate JSON
-        try:
-            json.loads(prompt_json)
-        except json.JSONDecodeError:
-            raise HTTPException(status_code=400, detail="Invalid JSON in prompt_json")
+        prompt_data = _parse_prompt_json(prompt_json)
 
         # Check if question with this q_id already exists
-        statement = select(Question).where(Question.q_id == q_id)
-        existing = session.exec(statement).first()
+        existing = session.exec(_QUESTION_ID_BY_Q_ID, params={"q_id": q_id}).first()
         if existing:
             raise HTTPException(status_code=400, detail=f"Question with q_id {q_id} already exists")
 
         # Create new question
         question = Question(
             q_id=q_id,
-            prompt_json=prompt_json,
+            prompt_json=prompt_data,
             is_active=is_active,
             search_label=search_label,
             auto_increment=auto_increment
         )
         session.add(question)
         session.commit()
-        session.refresh(question)
+        QUESTION_CACHE[q_id] = prompt_data
 
-        return {
+        return _json_response({
             "message": "Question created successfully",
             "id": question.id,
             "q_id": question.q_id,
-            "prompt_json": json.loads(question.prompt_json),
+            "prompt_json": prompt_data,
             "is_active": question.is_active,
             "search_label": question.search_label,
             "auto_increment": question.auto_increment
-        }
+        })
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to create question: {str(e)}")
 
 @app.put("/questions/{q_id}")
-async def update_question(
+def update_question(
     q_id: str,
     prompt_json: str = Form(...),
     is_active: bool = Form(True),
@@ -937,54 +1955,102 @@ async def update_question(
 ):
     """Update an existing evaluation question"""
     try:
-        # Validate JSON
-        try:
-            json.loads(prompt_json)
-        except json.JSONDecodeError:
-            raise HTTPException(status_code=400, detail="Invalid JSON in prompt_json")
+        prompt_data = _parse_prompt_json(prompt_json)
 
         # Find existing question
-        statement = select(Question).where(Question.q_id == q_id)
-        question = session.exec(statement).first()
+        question = session.exec(_QUESTION_BY_Q_ID, params={"q_id": q_id}).first()
         if not question:
             raise HTTPException(status_code=404, detail=f"Question {q_id} not found")
 
         # Update question
-        question.prompt_json = prompt_json
+        question.prompt_json = prompt_data
         question.is_active = is_active
         question.search_label = search_label
         question.auto_increment = auto_increment
         session.add(question)
         session.commit()
-        session.refresh(question)
+        QUESTION_CACHE[q_id] = prompt_data
 
-        return {
+        return _json_response({
             "message": "Question updated successfully",
             "id": question.id,
             "q_id": question.q_id,
-            "prompt_json": json.loads(question.prompt_json),
+            "prompt_json": prompt_data,
             "is_active": question.is_active,
             "search_label": question.search_label,
             "auto_increment": question.auto_increment
-        }
+        })
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to update question: {str(e)}")
+
+@app.patch("/questions/{q_id}")
+def patch_question(
+    q_id: str,
+    prompt_json: Optional[str] = Form(None),
+    is_active: Optional[bool] = Form(None),
+    search_label: Optional[str] = Form(None),
+    auto_increment: Optional[bool] = Form(None),
+    session: Session = Depends(get_session)
+):
+    """Update only the fields sent; the others keep their stored values"""
+    try:
+        values = {}
+        if prompt_json is not None:
+            values["prompt_json"] = _parse_prompt_json(prompt_json)
+        if is_active is not None:
+            values["is_active"] = is_active
+        if search_label is not None:
+            values["search_label"] = search_label
+        if auto_increment is not None:
+            values["auto_increment"] = auto_increment
+
+        if values:
+            # One UPDATE of just the sent columns, returning the row instead of loading it first
+            statement = (
+                update(Question)
+                .where(Question.q_id == q_id)
+                .values(**values)
+                .returning(*_QUESTION_COLUMNS)
+            )
+            question = session.exec(statement).first()
+            session.commit()
+        else:
+            question = session.exec(_QUESTION_ROW_BY_Q_ID, params={"q_id": q_id}).first()
+
+        if not question:
+            raise HTTPException(status_code=404, detail=f"Question {q_id} not found")
+        if "prompt_json" in values:
+            QUESTION_CACHE[q_id] = values["prompt_json"]
+
+        return _json_response({
+            "message": "Question updated successfully",
+            "id": question.id,
+            "q_id": question.q_id,
+            "prompt_json": _cached_prompt_data(question),
+            "is_active": question.is_active,
+            "search_label": question.search_label,
+            "auto_increment": question.auto_increment
+        })
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to update question: {str(e)}")
 
 @app.delete("/questions/{q_id}")
-async def delete_question(q_id: str, session: Session = Depends(get_session)):
+def delete_question(q_id: str, session: Session = Depends(get_session)):
     """Delete an evaluation question"""
     try:
         # Find existing question
-        statement = select(Question).where(Question.q_id == q_id)
-        question = session.exec(statement).first()
+        question = session.exec(_QUESTION_BY_Q_ID, params={"q_id": q_id}).first()
         if not question:
             raise HTTPException(status_code=404, detail=f"Question {q_id} not found")
 
         # Delete question
         session.delete(question)
         session.commit()
+        QUESTION_CACHE.pop(q_id, None)
 
         return {
             "message": f"Question {q_id} deleted successfully"
@@ -994,28 +2060,53 @@ async def delete_question(q_id: str, session: Session = Depends(get_session)):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to delete question: {str(e)}")
 
+def _invalidate_keywords_cache():
+    global _keywords_generation, _keywords_cache
+    _keywords_generation += 1
+    _keywords_cache = None
+
 @app.get("/search-keywords")
-async def list_search_keywords(session: Session = Depends(get_session)):
+def list_search_keywords(request: Request, session: Session = Depends(get_session)):
     """List all search keywords for PDF extraction"""
+    global _keywords_cache
     try:
-        statement = select(SearchKeyword).order_by(SearchKeyword.keyword)
-        keywords = session.exec(statement).all()
-
-        result = []
-        for keyword in keywords:
-            result.append({
-                "id": keyword.id,
-                "keyword": keyword.keyword,
-                "is_active": keyword.is_active,
-                "created_at": keyword.created_at.isoformat()
-            })
+        generation = _keywords_generation
+        probe = tuple(session.exec(select(func.max(SearchKeyword.created_at), func.count(SearchKeyword.id))).one())
+        cached = _keywords_cache
+        if (
+            cached is None
+            or cached["generation"] != generation
+            or cached["probe"] != probe
+            or time.monotonic() - cached["cached_at"] >= KEYWORDS_CACHE_TTL
+        ):
+            statement = select(SearchKeyword).order_by(SearchKeyword.keyword)
+            keywords = session.exec(statement).all()
+
+            result = []
+            for keyword in keywords:
+                result.append({
+                    "id": keyword.id,
+                    "keyword": keyword.keyword,
+                    "is_active": keyword.is_active,
+                    "created_at": keyword.created_at.isoformat()
+                })
 
-        return {"keywords": result}
+            body = json_utils.dumps_bytes({"keywords": result})
+            # Derived from the body, so an unchanged list keeps its ETag across cache refreshes
+            etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+            cached = {"generation": generation, "probe": probe, "cached_at": time.monotonic(), "body": body, "etag": etag}
+            _keywords_cache = cached
+
+        # no-cache: browsers keep the body but revalidate with If-None-Match on every request
+        headers = {"ETag": cached["etag"], "Cache-Control": "no-cache"}
+        if request.headers.get("if-none-match") == cached["etag"]:
+            return Response(status_code=304, headers=headers)
+        return Response(content=cached["body"], media_type="application/json", headers=headers)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to list search keywords: {str(e)}")
 
 @app.post("/search-keywords")
-async def create_search_keyword(
+def create_search_keyword(
     keyword: str = Form(...),
     is_active: bool = Form(True),
     session: Session = Depends(get_session)
@@ -1035,7 +2126,7 @@ async def create_search_keyword(
         )
         session.add(new_keyword)
         session.commit()
-        session.refresh(new_keyword)
+        _invalidate_keywords_cache()
 
         return {
             "message": "Search keyword created successfully",
@@ -1050,7 +2141,7 @@ async def create_search_keyword(
         raise HTTPException(status_code=500, detail=f"Failed to create search keyword: {str(e)}")
 
 @app.put("/search-keywords/{keyword_id}")
-async def update_search_keyword(
+def update_search_keyword(
     keyword_id: int,
     keyword: str = Form(...),
     is_active: bool = Form(True),
@@ -1068,7 +2159,7 @@ async def update_search_keyword(
         existing_keyword.is_active = is_active
         session.add(existing_keyword)
         session.commit()
-        session.refresh(existing_keyword)
+        _invalidate_keywords_cache()
 
         return {
             "message": "Search keyword updated successfully",
@@ -1083,7 +2174,7 @@ async def update_search_keyword(
         raise HTTPException(status_code=500, detail=f"Failed to update search keyword: {str(e)}")
 
 @app.delete("/search-keywords/{keyword_id}")
-async def delete_search_keyword(keyword_id: int, session: Session = Depends(get_session)):
+def delete_search_keyword(keyword_id: int, session: Session = Depends(get_session)):
     """Delete a search keyword"""
     try:
         # Find existing keyword
@@ -1094,6 +2185,7 @@ async def delete_search_keyword(keyword_id: int, session: Session = Depends(get_
         # Delete keyword
         session.delete(keyword)
         session.commit()
+        _invalidate_keywords_cache()
 
         return {
             "message": f"Search keyword '{keyword.keyword}' deleted successfully"
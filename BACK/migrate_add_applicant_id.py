@@ -12,6 +12,11 @@ def migrate():
     cursor = conn.cursor()
 
     try:
+        # Same journal settings as the API; WAL plus synchronous=NORMAL saves an fsync per commit
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+
         # Check if column already exists
         cursor.execute("PRAGMA table_info(pdfoorcrcache)")
         columns = [row[1] for row in cursor.fetchall()]
@@ -20,6 +25,9 @@ def migrate():
             print("✓ Column 'applicant_id' already exists in pdfoorcrcache table")
             return
 
+        # sqlite3 autocommits DDL; one explicit transaction makes the column and its index atomic
+        cursor.execute("BEGIN IMMEDIATE")
+
         # Add the column
         print("Adding 'applicant_id' column to pdfoorcrcache table...")
         cursor.execute("""
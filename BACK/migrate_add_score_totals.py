@@ -0,0 +1,66 @@
+"""
+Migration script to add score_sum / score_count columns to Applicant table
+and backfill them from existing assessment results.
+Run this once to update existing database
+"""
+import sqlite3
+from pathlib import Path
+
+DATABASE_PATH = Path(__file__).parent / "data" / "tender_evaluation.db"
+
+def migrate():
+    conn = sqlite3.connect(DATABASE_PATH)
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+
+        # Check if columns already exist
+        cursor.execute("PRAGMA table_info(applicant)")
+        columns = [row[1] for row in cursor.fetchall()]
+
+        if "score_sum" in columns and "score_count" in columns:
+            print("✓ Columns 'score_sum' and 'score_count' already exist in applicant table")
+            return
+
+        # Both ALTERs and the backfill commit together (sqlite3 would autocommit each ALTER)
+        cursor.execute("BEGIN IMMEDIATE")
+
+        # Add the columns
+        print("Adding 'score_sum' and 'score_count' columns to applicant table...")
+        if "score_sum" not in columns:
+            cursor.execute("ALTER TABLE applicant ADD COLUMN score_sum FLOAT NOT NULL DEFAULT 0")
+        if "score_count" not in columns:
+            cursor.execute("ALTER TABLE applicant ADD COLUMN score_count INTEGER NOT NULL DEFAULT 0")
+
+        # Backfill running totals from stored assessments
+        print("Backfilling score totals from assessmentresult...")
+        cursor.execute("""
+            UPDATE applicant SET
+                score_sum = COALESCE((
+                    SELECT SUM(score) FROM assessmentresult
+                    WHERE assessmentresult.applicant_id = applicant.id
+                ), 0),
+                score_count = (
+                    SELECT COUNT(score) FROM assessmentresult
+                    WHERE assessmentresult.applicant_id = applicant.id
+                )
+        """)
+
+        conn.commit()
+        print("✓ Migration completed successfully!")
+
+    except sqlite3.Error as e:
+        print(f"✗ Migration failed: {e}")
+        conn.rollback()
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    if not DATABASE_PATH.exists():
+        print(f"✗ Database not found at {DATABASE_PATH}")
+        print("Start your application first to create the database.")
+    else:
+        migrate()
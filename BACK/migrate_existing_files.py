@@ -0,0 +1,64 @@
+"""
+Migration script to register PDF files already in the uploads directory as applicants.
+Files whose name is already recorded are skipped; the vendor name is the file name without .pdf.
+Run this once to update existing database
+"""
+from datetime import datetime
+from pathlib import Path
+
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import OperationalError
+from sqlmodel import Session
+
+from data.createBlankDatabase import engine, init_db_if_needed
+from models import Applicant
+
+UPLOAD_DIR = Path("uploads")
+
+def migrate_existing_files():
+    pdf_files = sorted(UPLOAD_DIR.glob("*.pdf"))
+    if not pdf_files:
+        print(f"✓ No PDF files found in {UPLOAD_DIR}")
+        return
+
+    init_db_if_needed()
+
+    rows = []
+    for file_path in pdf_files:
+        stat = file_path.stat()
+        rows.append({
+            "vendor_name": file_path.stem,
+            "filename": file_path.name,
+            "file_path": str(file_path),
+            "file_size": stat.st_size,
+            "uploaded_at": datetime.utcfromtimestamp(stat.st_mtime),
+            "status": "uploaded"
+        })
+
+    # The unique filename index turns "already recorded?" into a conflict the INSERT skips,
+    # so there is no lookup beforehand; RETURNING reports which names were actually added
+    stmt = (
+        sqlite_insert(Applicant)
+        .on_conflict_do_nothing(index_elements=["filename"])
+        .returning(Applicant.filename)
+    )
+    try:
+        with Session(engine) as session, session.begin():
+            added = set(session.scalars(stmt, rows).all())
+    except OperationalError as e:
+        # ON CONFLICT(filename) needs ix_applicant_filename, which is missing if names were duplicated
+        print(f"✗ Migration failed: {e}")
+        return
+
+    for row in rows:
+        if row["filename"] in added:
+            print(f"+ Added {row['filename']} (vendor: {row['vendor_name']})")
+        else:
+            print(f"- Skipping {row['filename']} (already in database)")
+    print(f"✓ Migration completed: {len(added)} added, {len(pdf_files) - len(added)} skipped")
+
+if __name__ == "__main__":
+    if not UPLOAD_DIR.exists():
+        print(f"✗ Uploads directory not found at {UPLOAD_DIR.resolve()}")
+    else:
+        migrate_existing_files()
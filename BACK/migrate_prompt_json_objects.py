@@ -0,0 +1,42 @@
+"""
+Migration script to store question.prompt_json as a JSON object instead of a JSON-encoded
+string holding the object (how questions were saved before the column held dicts).
+Run this once to update existing database
+"""
+import sqlite3
+from pathlib import Path
+
+DATABASE_PATH = Path(__file__).parent / "data" / "tender_evaluation.db"
+
+def migrate():
+    conn = sqlite3.connect(DATABASE_PATH)
+    cursor = conn.cursor()
+
+    try:
+        # A double-encoded prompt is a JSON text value whose content is itself valid JSON
+        cursor.execute("""
+            UPDATE question SET prompt_json = json_extract(prompt_json, '$')
+            WHERE json_valid(prompt_json)
+              AND json_type(prompt_json) = 'text'
+              AND json_valid(json_extract(prompt_json, '$'))
+        """)
+        if cursor.rowcount == 0:
+            print("✓ All question prompts are already stored as JSON objects")
+            return
+
+        print(f"Unwrapped prompt_json of {cursor.rowcount} question(s)")
+        conn.commit()
+        print("✓ Migration completed successfully!")
+
+    except sqlite3.Error as e:
+        print(f"✗ Migration failed: {e}")
+        conn.rollback()
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    if not DATABASE_PATH.exists():
+        print(f"✗ Database not found at {DATABASE_PATH}")
+        print("Start your application first to create the database.")
+    else:
+        migrate()
@@ -0,0 +1,87 @@
+"""
+Migration script to add unique (applicant_id, q_id) indexes to the applicantanswer
+and assessmentresult tables. Duplicate rows are removed first (the newest row is kept)
+and the running score totals are recomputed from the remaining assessments.
+Run this once to update existing database
+"""
+import sqlite3
+from pathlib import Path
+
+DATABASE_PATH = Path(__file__).parent / "data" / "tender_evaluation.db"
+
+INDEXES = {
+    "applicantanswer": "ix_applicantanswer_applicant_id_q_id",
+    "assessmentresult": "ix_assessmentresult_applicant_id_q_id",
+}
+
+def migrate():
+    conn = sqlite3.connect(DATABASE_PATH)
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+        existing = {row[0] for row in cursor.fetchall()}
+
+        if all(index in existing for index in INDEXES.values()):
+            print("✓ Unique (applicant_id, q_id) indexes already exist")
+            return
+
+        # Dedupe, index creation and the totals rebuild succeed or fail as one
+        cursor.execute("BEGIN IMMEDIATE")
+
+        for table, index in INDEXES.items():
+            if index in existing:
+                continue
+
+            # Keep the newest row of each (applicant_id, q_id) pair
+            cursor.execute(f"""
+                DELETE FROM {table}
+                WHERE id NOT IN (
+                    SELECT MAX(id) FROM {table} GROUP BY applicant_id, q_id
+                )
+            """)
+            print(f"Removed {cursor.rowcount} duplicate row(s) from {table}")
+
+            print(f"Creating unique index {index}...")
+            cursor.execute(f"CREATE UNIQUE INDEX {index} ON {table} (applicant_id, q_id)")
+
+        # Removed assessments may have contributed to the running score totals
+        cursor.execute("PRAGMA table_info(applicant)")
+        columns = [row[1] for row in cursor.fetchall()]
+        if "score_sum" in columns and "score_count" in columns:
+            print("Recomputing score totals from assessmentresult...")
+            cursor.execute("""
+                UPDATE applicant SET
+                    score_sum = COALESCE((
+                        SELECT SUM(score) FROM assessmentresult
+                        WHERE assessmentresult.applicant_id = applicant.id
+                    ), 0),
+                    score_count = (
+                        SELECT COUNT(score) FROM assessmentresult
+                        WHERE assessmentresult.applicant_id = applicant.id
+                    )
+            """)
+            cursor.execute("""
+                UPDATE applicant SET evaluation_score = score_sum / score_count
+                WHERE score_count > 0
+            """)
+
+        conn.commit()
+        print("✓ Migration completed successfully!")
+
+    except sqlite3.Error as e:
+        print(f"✗ Migration failed: {e}")
+        conn.rollback()
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    if not DATABASE_PATH.exists():
+        print(f"✗ Database not found at {DATABASE_PATH}")
+        print("Start your application first to create the database.")
+    else:
+        migrate()
@@ -1,5 +1,5 @@
 from sqlmodel import SQLModel, Field, Column
-from sqlalchemy import JSON, ForeignKey
+from sqlalchemy import JSON, ForeignKey, Index
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 import json
@@ -8,15 +8,17 @@ class Applicant(SQLModel, table=True):
     """Applicant/Vendor model for storing uploaded tender applications"""
     id: Optional[int] = Field(default=None, primary_key=True)
     vendor_name: str = Field(index=True)
-    filename: str
+    filename: str = Field(index=True, unique=True)  # Upload names are unique on disk; migrate_existing_files.py upserts on it
     file_path: str
     file_size: int
-    uploaded_at: datetime = Field(default_factory=datetime.utcnow)
+    uploaded_at: datetime = Field(default_factory=datetime.utcnow, index=True)  # /uploads sorts by it
     status: str = Field(default="uploaded")  # uploaded, processing, completed, error
 
     # Additional fields for tender evaluation
     evaluation_score: Optional[float] = None
-    evaluation_result: Optional[str] = None  # JSON string with detailed results
+    score_sum: float = Field(default=0.0)  # Sum of non-null assessment scores, rebuilt by each evaluation
+    score_count: int = Field(default=0)  # Number of assessments contributing to score_sum
+    evaluation_result: Optional[dict] = Field(default=None, sa_column=Column(JSON(none_as_null=True)))  # Legacy per-question results; no longer written, AssessmentResult holds them
     processed_at: Optional[datetime] = None
 
     class Config:
@@ -33,9 +35,12 @@ class Applicant(SQLModel, table=True):
 
 class Question(SQLModel, table=True):
     """Evaluation question model for LLM prompts"""
+    # Serves the active-questions listing (filter on is_active, ordered by q_id)
+    __table_args__ = (Index("ix_question_is_active_q_id", "is_active", "q_id"),)
+
     id: Optional[int] = Field(default=None, primary_key=True)
     q_id: str = Field(index=True, unique=True)  # e.g., "Q2"
-    prompt_json: str = Field(sa_column=Column(JSON))  # Full prompt structure as JSON
+    prompt_json: Dict[str, Any] = Field(sa_column=Column(JSON))  # Full prompt structure, (de)serialized by the column
     created_at: datetime = Field(default_factory=datetime.utcnow)
     is_active: bool = Field(default=True)  # To enable/disable questions
 
@@ -62,6 +67,9 @@ class Question(SQLModel, table=True):
 
 class ApplicantAnswer(SQLModel, table=True):
     """Stores applicant answers to specific questions"""
+    # One answer per applicant and question; also serves the (applicant_id, q_id) lookups and the UPSERT
+    __table_args__ = (Index("ix_applicantanswer_applicant_id_q_id", "applicant_id", "q_id", unique=True),)
+
     id: Optional[int] = Field(default=None, primary_key=True)
     applicant_id: int = Field(sa_column=Column("applicant_id", ForeignKey("applicant.id", ondelete="CASCADE"), index=True))
     q_id: str = Field(index=True)  # Question ID (e.g., "Q2")
@@ -83,6 +91,9 @@ class ApplicantAnswer(SQLModel, table=True):
 
 class AssessmentResult(SQLModel, table=True):
     """Stores LLM assessment results for applicant answers"""
+    # One assessment per applicant and question; serves the (applicant_id, q_id) lookups
+    __table_args__ = (Index("ix_assessmentresult_applicant_id_q_id", "applicant_id", "q_id", unique=True),)
+
     id: Optional[int] = Field(default=None, primary_key=True)
     applicant_id: int = Field(sa_column=Column("applicant_id", ForeignKey("applicant.id", ondelete="CASCADE"), index=True))
     q_id: str = Field(index=True)  # Question ID (e.g., "Q2")
@@ -134,7 +145,7 @@ class LLMConfig(SQLModel, table=True):
 class PDFOCRCache(SQLModel, table=True):
     """Cache for OCR-extracted text from scanned PDFs"""
     id: Optional[int] = Field(default=None, primary_key=True)
-    page_hash: str = Field(index=True, unique=True)  # SHA256 hash of file path + page number
+    page_hash: str = Field(index=True, unique=True)  # Hash of page content + page number (xxh3: prefix or SHA256)
     pdf_path: str  # Path to the PDF file
     page_num: int  # Page number (0-indexed)
     extracted_text: str  # OCR-extracted text
@@ -153,3 +164,26 @@ class PDFOCRCache(SQLModel, table=True):
                 "applicant_id": 1
             }
         }
+
+
+class LLMResponseCache(SQLModel, table=True):
+    """Cache of LLM replies keyed by a hash of provider, model and prompt"""
+    key: str = Field(primary_key=True)  # SHA1 hex of provider + model + prompt (the prompt itself is not stored)
+    model: str  # Model that produced the response
+    response: str  # Raw LLM reply
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class EvaluationBatch(SQLModel, table=True):
+    """Batch API jobs whose results have been stored, so a completed batch is ingested only once"""
+    batch_id: str = Field(primary_key=True)
+    ingested_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class AnswerEmbedding(SQLModel, table=True):
+    """Embedded answers with the LLM reply they received, for the semantic evaluation cache"""
+    id: Optional[int] = Field(default=None, primary_key=True)
+    question_key: str = Field(index=True)  # SHA1 hex of provider + model + embedding model + question prompt
+    embedding: bytes  # Unit-length float32 vector of the answer text
+    response: str  # Raw LLM reply for that answer
+    created_at: datetime = Field(default_factory=datetime.utcnow)
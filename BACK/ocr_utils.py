@@ -3,82 +3,234 @@ OCR utilities for handling scanned PDFs using LLM-based text extraction.
 Provides hybrid approach: try native text extraction first, fall back to LLM OCR if needed.
 """
 import fitz
-import base64
 import io
+import logging
 from pathlib import Path
 from PIL import Image
 import openai
 import os
-from typing import Optional, Tuple
+from typing import Dict, Iterator, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager, nullcontext
+from functools import lru_cache
 import hashlib
+import re
+import struct
+import threading
+from datetime import datetime
+from sqlmodel import Session, select
+from models import PDFOCRCache
 
+try:
+    # SIMD-accelerated drop-in replacement for the stdlib encoder
+    import pybase64 as base64
+except ImportError:
+    import base64
 
-def is_scanned_pdf(pdf_path: Path, page_num: int = 0) -> bool:
+try:
+    # Non-cryptographic SIMD hash; page fingerprints only need to be unique, not secure
+    import xxhash
+except ImportError:
+    xxhash = None
+
+log = logging.getLogger(__name__)
+
+# Upper bound on concurrent LLM OCR requests for a single PDF
+OCR_MAX_WORKERS = 8
+
+# Number of scanned pages sent to the LLM in one vision request
+OCR_BATCH_SIZE = 4
+
+# Separator the LLM is asked to emit before each page of a batched OCR response
+_PAGE_MARKER = re.compile(r"^\s*=== PAGE (\d+) ===\s*$", re.MULTILINE)
+
+# Longest rendered side in pixels for OCR images (OpenAI high-detail tile boundary)
+OCR_MAX_LONG_SIDE = 2048
+
+# Render resolution and JPEG quality of page images sent for OCR. High-detail vision input is
+# scaled to a 768 px short side anyway, so 150 DPI keeps text legible at a fraction of the bytes.
+OCR_DPI = int(os.getenv("OCR_DPI", "150"))
+OCR_JPEG_QUALITY = int(os.getenv("OCR_JPEG_QUALITY", "75"))
+
+# Binary layout of one image placement in the page hash: bbox (4 floats), width, height
+_IMAGE_SIG = struct.Struct("<ffffii")
+
+
+@lru_cache(maxsize=16)
+def _open_doc_cached(pdf_path: str, mtime_ns: int) -> Tuple[fitz.Document, threading.RLock]:
+    # Open from memory so the cached document does not hold the file handle
+    # (the upload can still be deleted or replaced on Windows)
+    return fitz.open(stream=Path(pdf_path).read_bytes(), filetype="pdf"), threading.RLock()
+
+
+@contextmanager
+def open_pdf(pdf_path: Path) -> Iterator[fitz.Document]:
+    """
+    Use a parsed PDF document, reused across calls until the file changes.
+    Callers must not close the document or keep it beyond the with block.
+
+    The block holds the document's lock: PyMuPDF objects must not be used from two
+    threads at once, and /extract-answer runs on threadpool workers. Keep network
+    calls such as OCR requests outside the block. The lock is re-entrant.
+    """
+    doc, lock = _open_doc_cached(str(pdf_path), pdf_path.stat().st_mtime_ns)
+    with lock:
+        yield doc
+
+
+def _use_pdf(pdf_path: Path, doc: Optional[fitz.Document]):
+    """open_pdf(), or the document a caller already holds open."""
+    return nullcontext(doc) if doc is not None else open_pdf(pdf_path)
+
+
+def _page_features(page: fitz.Page) -> Tuple[str, list]:
+    """
+    Collect the plain text and image placements of a page in one pass.
+    get_image_info() reads image placements without building the full
+    text layout tree that get_text("dict") would.
+
+    Returns:
+        Tuple of (text, image_sigs) where each image sig is (bbox, width, height)
+    """
+    text = page.get_text("text")
+    image_sigs = [(info["bbox"], info["width"], info["height"]) for info in page.get_image_info()]
+    return text, image_sigs
+
+
+def _render_matrix(page: fitz.Page, dpi: int, max_long_side: Optional[int]) -> fitz.Matrix:
+    # zoom factor: dpi/72 (72 is the default DPI), reduced so the longest side fits max_long_side
+    zoom = dpi / 72
+    if max_long_side:
+        long_side = max(page.rect.width, page.rect.height)
+        if long_side * zoom > max_long_side:
+            zoom = max_long_side / long_side
+    return fitz.Matrix(zoom, zoom)
+
+
+def extract_page(doc: fitz.Document, page_num: int) -> Tuple[str, bool]:
+    """
+    Extract the native text of a page and decide whether it needs OCR.
+    Pages with real text return after a single get_text("text") call; image
+    placements are only inspected when that text is too short.
+
+    Args:
+        doc: Opened PDF document
+        page_num: Page number to extract (0-indexed)
+
+    Returns:
+        Tuple of (text, needs_ocr)
+        - text: Native text of the page (empty string if the page needs OCR;
+          short text is kept on pages without images, e.g. a lone heading)
+        - needs_ocr: True if the page is scanned (little text and has images)
+    """
+    if page_num >= len(doc):
+        return "", False
+
+    page = doc[page_num]
+    text = page.get_text("text")
+
+    # More than 50 chars suggests real text
+    if len(text.strip()) > 50:
+        return text, False
+
+    # Scanned if little text and has images; otherwise the short text is all there is
+    if page.get_image_info():
+        return "", True
+    return text, False
+
+
+def is_scanned_pdf(pdf_path: Path, page_num: int = 0, doc: Optional[fitz.Document] = None) -> bool:
     """
     Detect if a PDF page is scanned (image-based) or contains real text.
 
     Args:
         pdf_path: Path to the PDF file
         page_num: Page number to check (0-indexed)
+        doc: Already opened document (defaults to the shared document cache)
 
     Returns:
         True if the page is scanned (no extractable text), False otherwise
     """
     try:
-        with fitz.open(str(pdf_path)) as doc:
-            if page_num >= len(doc):
-                return False
-
-            page = doc[page_num]
-            text = page.get_text("text").strip()
-
-            # If there's substantial text, it's not a scanned document
-            if len(text) > 50:  # More than 50 chars suggests real text
-                return False
-
-            # Check if there are image blocks
-            text_dict = page.get_text("dict")
-            blocks = text_dict.get("blocks", [])
-            image_blocks = [b for b in blocks if b.get("type") == 1]
-
-            # Scanned if no text and has images
-            return len(text) < 50 and len(image_blocks) > 0
+        with _use_pdf(pdf_path, doc) as doc:
+            return extract_page(doc, page_num)[1]
     except Exception:
         return False
 
 
-def pdf_page_to_image(pdf_path: Path, page_num: int = 0, dpi: int = 200) -> Optional[Image.Image]:
+def pdf_page_to_image(
+    pdf_path: Path,
+    page_num: int = 0,
+    dpi: int = OCR_DPI,
+    doc: Optional[fitz.Document] = None,
+    max_long_side: Optional[int] = OCR_MAX_LONG_SIDE
+) -> Optional[Image.Image]:
     """
     Convert a PDF page to a PIL Image.
 
     Args:
         pdf_path: Path to the PDF file
         page_num: Page number to convert (0-indexed)
-        dpi: Resolution for rendering (default 200 DPI for good OCR quality)
+        dpi: Resolution for rendering (default OCR_DPI)
+        doc: Already opened document (defaults to the shared document cache)
+        max_long_side: Cap on the longest side in pixels (None to disable)
 
     Returns:
         PIL Image object or None if conversion fails
     """
     try:
-        with fitz.open(str(pdf_path)) as doc:
+        with _use_pdf(pdf_path, doc) as doc:
             if page_num >= len(doc):
                 return None
 
             page = doc[page_num]
 
-            # Render page to pixmap at specified DPI
-            # zoom factor: dpi/72 (72 is the default DPI)
-            zoom = dpi / 72
-            mat = fitz.Matrix(zoom, zoom)
-            pix = page.get_pixmap(matrix=mat)
+            # Render page to pixmap at specified DPI (capped to max_long_side)
+            mat = _render_matrix(page, dpi, max_long_side)
+            pix = page.get_pixmap(matrix=mat, alpha=False)
 
-            # Convert pixmap to PIL Image
-            img_data = pix.tobytes("png")
-            img = Image.open(io.BytesIO(img_data))
+        # Wrap the raw samples directly (no PNG encode/decode round-trip)
+        mode = "RGBA" if pix.alpha else "RGB"
+        img = Image.frombuffer(mode, (pix.width, pix.height), pix.samples, "raw", mode, pix.stride, 1)
 
-            return img
+        return img
     except Exception as e:
-        print(f"Error converting PDF page to image: {e}")
+        log.error("Error converting PDF page to image: %s", e)
+        return None
+
+
+def pdf_page_to_jpeg(
+    pdf_path: Path,
+    page_num: int = 0,
+    dpi: int = OCR_DPI,
+    quality: int = OCR_JPEG_QUALITY,
+    doc: Optional[fitz.Document] = None,
+    max_long_side: Optional[int] = OCR_MAX_LONG_SIDE
+) -> Optional[bytes]:
+    """
+    Render a PDF page straight to JPEG bytes using MuPDF's encoder.
+
+    Args:
+        pdf_path: Path to the PDF file
+        page_num: Page number to convert (0-indexed)
+        dpi: Resolution for rendering (default OCR_DPI)
+        quality: JPEG quality (default OCR_JPEG_QUALITY)
+        doc: Already opened document (defaults to the shared document cache)
+        max_long_side: Cap on the longest side in pixels (None to disable)
+
+    Returns:
+        JPEG bytes or None if conversion fails
+    """
+    try:
+        with _use_pdf(pdf_path, doc) as doc:
+            if page_num >= len(doc):
+                return None
+
+            page = doc[page_num]
+            pix = page.get_pixmap(matrix=_render_matrix(page, dpi, max_long_side), alpha=False)
+        return pix.tobytes("jpg", jpg_quality=quality)
+    except Exception as e:
+        log.error("Error converting PDF page to JPEG: %s", e)
         return None
 
 
@@ -86,50 +238,92 @@ def get_page_hash(pdf_path: Path, page_num: int) -> str:
     """
     Generate a hash for a PDF page to use as cache key.
     Uses the actual page content to ensure different PDFs with same filename
-    get different cache entries.
+    get different cache entries. Results are memoized per (file, mtime, page)
+    so lookup and write-back for the same page hash it only once.
 
     Args:
         pdf_path: Path to the PDF file
         page_num: Page number
 
     Returns:
-        SHA256 hash of the PDF page content
+        Hash of the PDF page content: "xxh3:" + XXH3-128 when xxhash is installed, else SHA256
     """
     try:
-        with fitz.open(str(pdf_path)) as doc:
+        mtime_ns = pdf_path.stat().st_mtime_ns
+    except OSError as e:
+        log.error("Error generating page hash: %s", e)
+        return hashlib.sha256(f"{pdf_path.absolute()}:{page_num}:error".encode()).hexdigest()
+
+    return _page_hash_cached(str(pdf_path.absolute()), mtime_ns, page_num)
+
+
+@lru_cache(maxsize=4096)
+def _page_hash_cached(pdf_path: str, mtime_ns: int, page_num: int) -> str:
+    return _hash_impl(Path(pdf_path), page_num)
+
+
+def _page_hasher():
+    """Incremental hasher for page content and the tag prefixed to its digest."""
+    # The tag keeps XXH3 keys apart from SHA256 keys already stored in PDFOCRCache
+    if xxhash is not None:
+        return xxhash.xxh3_128(), "xxh3:"
+    return hashlib.sha256(), ""
+
+
+def _hash_impl(pdf_path: Path, page_num: int) -> str:
+    try:
+        with open_pdf(pdf_path) as doc:
             if page_num >= len(doc):
                 # Fallback for invalid page number
                 return hashlib.sha256(f"{pdf_path.absolute()}:{page_num}:invalid".encode()).hexdigest()
 
-            page = doc[page_num]
-
             # Get the raw page content (text + image data)
             # This creates a unique fingerprint based on actual content
-            page_text = page.get_text("text")
-
-            # Get image blocks to include in hash
-            text_dict = page.get_text("dict")
-            blocks = text_dict.get("blocks", [])
-            image_hashes = []
+            page_text, image_sigs = _page_features(doc[page_num])
 
-            for block in blocks:
-                if block.get("type") == 1:  # Image block
-                    # Include image dimensions and position as part of hash
-                    img_info = f"{block.get('bbox')}:{block.get('width')}:{block.get('height')}"
-                    image_hashes.append(img_info)
-
-            # Combine text content and image structure for unique hash
-            content_string = f"{page_text}:{'|'.join(image_hashes)}:{page_num}"
-            return hashlib.sha256(content_string.encode()).hexdigest()
+        # Feed the hasher incrementally instead of building one large string;
+        # image position and dimensions are packed as fixed-size binary records
+        h, tag = _page_hasher()
+        h.update(page_text.encode("utf-8", "replace"))
+        for bbox, width, height in image_sigs:
+            h.update(_IMAGE_SIG.pack(*bbox, int(width or 0), int(height or 0)))
+        h.update(page_num.to_bytes(4, "little"))
+        return tag + h.hexdigest()
 
     except Exception as e:
-        print(f"Error generating page hash: {e}")
+        log.error("Error generating page hash: %s", e)
         # Fallback to path-based hash with error marker
         return hashlib.sha256(f"{pdf_path.absolute()}:{page_num}:error".encode()).hexdigest()
 
 
+def _to_jpeg_bytes(image: Image.Image | bytes) -> bytes:
+    if isinstance(image, bytes):
+        return image
+
+    buffer = io.BytesIO()
+
+    # Convert to RGB if necessary (remove alpha channel)
+    if image.mode == "RGBA":
+        rgb_image = Image.new("RGB", image.size, (255, 255, 255))
+        rgb_image.paste(image, mask=image.split()[3])
+        image = rgb_image
+    elif image.mode != "RGB":
+        image = image.convert("RGB")
+
+    # Save as JPEG (more efficient than PNG for photos/scans);
+    # skip the extra optimize/progressive encoder passes
+    image.save(buffer, format="JPEG", quality=OCR_JPEG_QUALITY, optimize=False, progressive=False)
+    return buffer.getvalue()
+
+
+def _image_part(image: Image.Image | bytes) -> dict:
+    # Build the data URL as bytes and decode once
+    data_url = (b"data:image/jpeg;base64," + base64.b64encode(_to_jpeg_bytes(image))).decode("ascii")
+    return {"type": "image_url", "image_url": {"url": data_url}}
+
+
 def llm_ocr_page(
-    image: Image.Image,
+    image: Image.Image | bytes,
     client: openai.OpenAI,
     model: str = "gpt-4o"
 ) -> Optional[str]:
@@ -137,7 +331,7 @@ def llm_ocr_page(
     Use LLM vision capabilities to extract text from an image.
 
     Args:
-        image: PIL Image to extract text from
+        image: PIL Image or already encoded JPEG bytes to extract text from
         client: OpenAI client instance
         model: Model to use (must support vision)
 
@@ -145,22 +339,6 @@ def llm_ocr_page(
         Extracted text or None if extraction fails
     """
     try:
-        # Convert image to base64
-        buffer = io.BytesIO()
-
-        # Convert to RGB if necessary (remove alpha channel)
-        if image.mode == "RGBA":
-            rgb_image = Image.new("RGB", image.size, (255, 255, 255))
-            rgb_image.paste(image, mask=image.split()[3])
-            image = rgb_image
-        elif image.mode != "RGB":
-            image = image.convert("RGB")
-
-        # Save as JPEG (more efficient than PNG for photos/scans)
-        image.save(buffer, format="JPEG", quality=85)
-        img_bytes = buffer.getvalue()
-        encoded = base64.b64encode(img_bytes).decode("ascii")
-
         # Prompt for text extraction
         prompt = """Extract ALL text from this document image.
 Preserve the exact formatting, structure, headers, and layout as much as possible.
@@ -174,10 +352,7 @@ Preserve line breaks and spacing."""
                 "role": "user",
                 "content": [
                     {"type": "text", "text": prompt},
-                    {
-                        "type": "image_url",
-                        "image_url": {"url": f"data:image/jpeg;base64,{encoded}"}
-                    }
+                    _image_part(image)
                 ]
             }],
             temperature=0,
@@ -188,15 +363,70 @@ Preserve line breaks and spacing."""
         return extracted_text.strip() if extracted_text else None
 
     except Exception as e:
-        print(f"Error during LLM OCR: {e}")
+        log.error("Error during LLM OCR: %s", e)
         return None
 
 
+def llm_ocr_pages(
+    images: Dict[int, Image.Image | bytes],
+    client: openai.OpenAI,
+    model: str = "gpt-4o"
+) -> Dict[int, Optional[str]]:
+    """
+    Extract text from several page images with a single LLM vision request.
+    Falls back to one request per page if the response cannot be split by page.
+
+    Args:
+        images: Dict mapping page_num -> PIL Image or encoded JPEG bytes
+        client: OpenAI client instance
+        model: Model to use (must support vision)
+
+    Returns:
+        Dict mapping page_num -> extracted text (None if extraction failed)
+    """
+    if len(images) == 1:
+        page_num, image = next(iter(images.items()))
+        return {page_num: llm_ocr_page(image, client, model)}
+
+    try:
+        markers = ", ".join(f"=== PAGE {page_num} ===" for page_num in images)
+        prompt = f"""Extract ALL text from each of the following document images.
+The images are pages in this order: {markers}.
+Before the text of each page, output its marker on its own line exactly as given.
+Preserve the exact formatting, structure, headers, and layout as much as possible.
+Return ONLY the markers and the extracted text, with no additional commentary or explanation.
+Preserve line breaks and spacing."""
+
+        content = [{"type": "text", "text": prompt}]
+        content.extend(_image_part(image) for image in images.values())
+
+        response = client.chat.completions.create(
+            model=model,
+            messages=[{"role": "user", "content": content}],
+            temperature=0,
+            max_completion_tokens=4096 * len(images)
+        )
+
+        parts = _PAGE_MARKER.split(response.choices[0].message.content or "")
+        # parts = [preamble, page, text, page, text, ...]
+        results = {int(page): text.strip() or None for page, text in zip(parts[1::2], parts[2::2])}
+        if set(results) == set(images):
+            return results
+        log.warning("Batched LLM OCR response could not be split by page, retrying per page")
+    except Exception as e:
+        log.error("Error during batched LLM OCR: %s", e)
+
+    return {page_num: llm_ocr_page(image, client, model) for page_num, image in images.items()}
+
+
 def extract_text_hybrid(
     pdf_path: Path,
     page_num: int = 0,
     openai_client: Optional[openai.OpenAI] = None,
-    model: str = "gpt-4o"
+    model: str = "gpt-4o",
+    doc: Optional[fitz.Document] = None,
+    session: Optional[Session] = None,
+    applicant_id: Optional[int] = None
 ) -> Tuple[str, bool]:
     """
     Hybrid text extraction: try native extraction first, fall back to LLM OCR if needed.
@@ -206,6 +436,11 @@ def extract_text_hybrid(
         page_num: Page number to extract (0-indexed)
         openai_client: OpenAI client for OCR fallback (required for scanned PDFs)
         model: Model to use for OCR
+        doc: Already opened document (defaults to the shared document cache)
+        session: Database session for the OCR page cache; when given, a previous OCR of
+            the same page content is reused and a new result is added to the session as
+            a PDFOCRCache row (not committed - the caller commits it)
+        applicant_id: Applicant recorded on a new PDFOCRCache row
 
     Returns:
         Tuple of (extracted_text, used_ocr)
@@ -214,56 +449,177 @@ def extract_text_hybrid(
     """
     try:
         # Step 1: Try native text extraction
-        with fitz.open(str(pdf_path)) as doc:
-            if page_num >= len(doc):
-                return "", False
-
-            page = doc[page_num]
-            text = page.get_text("text")
-
-            # If we got substantial text, return it
-            if len(text.strip()) > 50:
-                return text, False
-
-        # Step 2: Detected scanned PDF - need OCR
+        with _use_pdf(pdf_path, doc) as pdf:
+            text, needs_ocr = extract_page(pdf, page_num)
+
+        # If we got substantial text (or there is nothing to OCR), return it
+        if not needs_ocr:
+            return text, False
+
+        # Step 2: Reuse a previous OCR of this exact page content
+        page_hash = None
+        if session is not None:
+            page_hash = get_page_hash(pdf_path, page_num)
+            # Don't flush rows queued for earlier pages just to read the cache
+            with session.no_autoflush:
+                cached = session.exec(
+                    select(PDFOCRCache).where(PDFOCRCache.page_hash == page_hash)
+                ).first()
+            if cached:
+                log.info("Using cached OCR text for page %d", page_num)
+                return cached.extracted_text, True
+
+        # Step 3: Detected scanned PDF - need OCR
         if not openai_client:
-            print("Warning: Scanned PDF detected but no OpenAI client provided for OCR")
+            log.warning("Scanned PDF detected but no OpenAI client provided for OCR")
             return "", False
 
-        print(f"Scanned PDF detected on page {page_num}. Using LLM OCR...")
+        log.info("Scanned PDF detected on page %d. Using LLM OCR...", page_num)
 
-        # Convert page to image
-        image = pdf_page_to_image(pdf_path, page_num)
+        # Render page straight to JPEG
+        image = pdf_page_to_jpeg(pdf_path, page_num, doc=doc)
         if not image:
-            print("Failed to convert PDF page to image")
+            log.warning("Failed to convert PDF page to image")
             return "", False
 
         # Use LLM for OCR
         ocr_text = llm_ocr_page(image, openai_client, model)
         if ocr_text:
-            print(f"LLM OCR successful: extracted {len(ocr_text)} characters")
+            log.info("LLM OCR successful: extracted %d characters", len(ocr_text))
+            if session is not None:
+                session.add(PDFOCRCache(
+                    page_hash=page_hash,
+                    pdf_path=str(pdf_path),
+                    page_num=page_num,
+                    extracted_text=ocr_text,
+                    model_used=model,
+                    applicant_id=applicant_id,
+                    created_at=datetime.utcnow()
+                ))
             return ocr_text, True
         else:
-            print("LLM OCR failed")
+            log.warning("LLM OCR failed")
             return "", True
 
     except Exception as e:
-        print(f"Error in hybrid text extraction: {e}")
+        log.error("Error in hybrid text extraction: %s", e)
         return "", False
 
 
+def extract_pages_hybrid(
+    pdf_path: Path,
+    page_nums: list[int],
+    openai_client: Optional[openai.OpenAI] = None,
+    model: str = "gpt-4o",
+    session: Optional[Session] = None,
+    applicant_id: Optional[int] = None,
+    max_workers: int = OCR_MAX_WORKERS
+) -> Dict[int, Tuple[str, bool]]:
+    """
+    extract_text_hybrid for several pages at once: cached OCR text is looked up
+    in one query and the remaining scanned pages are OCR'd concurrently.
+    New PDFOCRCache rows are added to the session but not committed.
+
+    Returns:
+        Dict mapping page_num -> (extracted_text, used_ocr), as extract_text_hybrid
+    """
+    results: Dict[int, Tuple[str, bool]] = {}
+    try:
+        # Native extraction and rendering stay on this thread under the document lock
+        # (PyMuPDF is not thread-safe); only the OCR requests go to worker threads
+        scanned = []
+        with open_pdf(pdf_path) as doc:
+            for page_num in page_nums:
+                text, needs_ocr = extract_page(doc, page_num)
+                if needs_ocr:
+                    scanned.append(page_num)
+                else:
+                    results[page_num] = (text, False)
+        if not scanned:
+            return results
+
+        page_hashes = {}
+        if session is not None:
+            page_hashes = {page_num: get_page_hash(pdf_path, page_num) for page_num in scanned}
+            with session.no_autoflush:
+                cached = {
+                    row.page_hash: row.extracted_text
+                    for row in session.exec(
+                        select(PDFOCRCache).where(PDFOCRCache.page_hash.in_(page_hashes.values()))
+                    )
+                }
+            for page_num, page_hash in page_hashes.items():
+                if page_hash in cached:
+                    log.info("Using cached OCR text for page %d", page_num)
+                    results[page_num] = (cached[page_hash], True)
+            scanned = [page_num for page_num in scanned if page_num not in results]
+            if not scanned:
+                return results
+
+        if not openai_client:
+            log.warning("Scanned PDF detected but no OpenAI client provided for OCR")
+            results.update((page_num, ("", False)) for page_num in scanned)
+            return results
+
+        log.info("Scanned PDF detected on %d page(s). Using LLM OCR...", len(scanned))
+        images = {}
+        with open_pdf(pdf_path) as doc:
+            for page_num in scanned:
+                image = pdf_page_to_jpeg(pdf_path, page_num, doc=doc)
+                if image:
+                    images[page_num] = image
+                else:
+                    log.warning("Failed to convert PDF page %d to image", page_num)
+                    results[page_num] = ("", False)
+        if not images:
+            return results
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(images))) as executor:
+            texts = dict(zip(images, executor.map(lambda image: llm_ocr_page(image, openai_client, model), images.values())))
+
+        for page_num, ocr_text in texts.items():
+            if not ocr_text:
+                log.warning("LLM OCR failed on page %d", page_num)
+                results[page_num] = ("", True)
+                continue
+            log.info("LLM OCR successful on page %d: extracted %d characters", page_num, len(ocr_text))
+            results[page_num] = (ocr_text, True)
+            if session is not None:
+                session.add(PDFOCRCache(
+                    page_hash=page_hashes[page_num],
+                    pdf_path=str(pdf_path),
+                    page_num=page_num,
+                    extracted_text=ocr_text,
+                    model_used=model,
+                    applicant_id=applicant_id,
+                    created_at=datetime.utcnow()
+                ))
+        return results
+    except Exception as e:
+        log.error("Error in hybrid text extraction: %s", e)
+        for page_num in page_nums:
+            results.setdefault(page_num, ("", False))
+        return results
+
+
 def extract_full_pdf_text_hybrid(
     pdf_path: Path,
     openai_client: Optional[openai.OpenAI] = None,
-    model: str = "gpt-4o"
+    model: str = "gpt-4o",
+    max_workers: int = OCR_MAX_WORKERS,
+    batch_size: int = OCR_BATCH_SIZE
 ) -> Tuple[dict, bool]:
     """
     Extract text from all pages of a PDF using hybrid approach.
+    Scanned pages are grouped into batches that are OCR'd concurrently,
+    since each LLM call is network-bound.
 
     Args:
         pdf_path: Path to the PDF file
         openai_client: OpenAI client for OCR fallback
         model: Model to use for OCR
+        max_workers: Maximum number of concurrent OCR requests
+        batch_size: Number of pages per OCR request
 
     Returns:
         Tuple of (page_texts, any_ocr_used)
@@ -271,24 +627,56 @@ def extract_full_pdf_text_hybrid(
         - any_ocr_used: True if OCR was used for any page
     """
     page_texts = {}
-    any_ocr_used = False
+    scanned_pages = []
 
     try:
-        with fitz.open(str(pdf_path)) as doc:
-            num_pages = len(doc)
-
-        for page_num in range(num_pages):
-            text, used_ocr = extract_text_hybrid(
-                pdf_path,
-                page_num,
-                openai_client,
-                model
-            )
-            page_texts[page_num] = text
-            if used_ocr:
-                any_ocr_used = True
-
-        return page_texts, any_ocr_used
+        # Native extraction is cheap and PyMuPDF is not thread-safe, so keep it on this thread
+        with open_pdf(pdf_path) as doc:
+            for page_num in range(len(doc)):
+                text, needs_ocr = extract_page(doc, page_num)
+                page_texts[page_num] = text
+                if needs_ocr:
+                    scanned_pages.append(page_num)
+
+        if not scanned_pages:
+            return page_texts, False
+
+        if not openai_client:
+            log.warning("Scanned PDF detected but no OpenAI client provided for OCR")
+            return page_texts, False
+
+        log.info("Scanned PDF detected on %d page(s). Using LLM OCR...", len(scanned_pages))
+
+        batches = []
+        batch = {}
+        with open_pdf(pdf_path) as doc:
+            for page_num in scanned_pages:
+                image = pdf_page_to_jpeg(pdf_path, page_num, doc=doc)
+                if not image:
+                    log.warning("Failed to convert PDF page %d to image", page_num)
+                    continue
+                batch[page_num] = image
+                if len(batch) == max(batch_size, 1):
+                    batches.append(batch)
+                    batch = {}
+        if batch:
+            batches.append(batch)
+
+        if not batches:
+            return page_texts, False
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+            futures = [executor.submit(llm_ocr_pages, batch, openai_client, model) for batch in batches]
+
+            for future in as_completed(futures):
+                for page_num, ocr_text in future.result().items():
+                    if ocr_text:
+                        log.info("LLM OCR successful on page %d: extracted %d characters", page_num, len(ocr_text))
+                        page_texts[page_num] = ocr_text
+                    else:
+                        log.warning("LLM OCR failed on page %d", page_num)
+
+        return page_texts, True
     except Exception as e:
-        print(f"Error extracting full PDF text: {e}")
+        log.error("Error extracting full PDF text: %s", e)
         return {}, False
@@ -0,0 +1,39 @@
+"""
+Vector helpers for the semantic evaluation cache.
+Answer embeddings are stored as unit-length float32 bytes, so cosine similarity is a dot product;
+numpy is used when installed and a pure-Python loop otherwise.
+"""
+import math
+from array import array
+from typing import Sequence
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def pack(vector: Sequence[float]) -> bytes:
+    """Normalize an embedding to unit length and pack it as float32 bytes."""
+    norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+    return array("f", (value / norm for value in vector)).tobytes()
+
+
+def best_match(query: bytes, candidates: Sequence[bytes]) -> tuple[int, float]:
+    """Index and cosine similarity of the candidate closest to query; (-1, -1.0) when there are none."""
+    if not candidates:
+        return -1, -1.0
+
+    if numpy is not None:
+        matrix = numpy.frombuffer(b"".join(candidates), dtype=numpy.float32).reshape(len(candidates), -1)
+        similarities = matrix @ numpy.frombuffer(query, dtype=numpy.float32)
+        index = int(similarities.argmax())
+        return index, float(similarities[index])
+
+    query_vector = array("f", query)
+    best_index, best_similarity = -1, -1.0
+    for index, candidate in enumerate(candidates):
+        similarity = sum(a * b for a, b in zip(query_vector, array("f", candidate)))
+        if similarity > best_similarity:
+            best_index, best_similarity = index, similarity
+    return best_index, best_similarity
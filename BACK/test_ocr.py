@@ -1,6 +1,7 @@
 """
 Test script for OCR functionality on scanned PDF
 """
+import logging
 import os
 from pathlib import Path
 from dotenv import load_dotenv
@@ -11,9 +12,14 @@ import re
 # Load environment variables
 load_dotenv()
 
+# Show the OCR progress messages from ocr_utils
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
 # Setup
 pdf_path = Path("uploads/Candidate123.pdf")
 search_term = "Team Management and Delivery Governance"
+# Compiled once; also used by step 4 to map a case-insensitive hit back onto the original text
+pattern = re.compile(re.escape(search_term), re.IGNORECASE)
 
 print("=" * 80)
 print("OCR FUNCTIONALITY TEST")
@@ -84,20 +90,25 @@ if search_term in extracted_text:
 else:
     print(f"✗ NOT FOUND (exact case)")
 
-# Case-insensitive search
-if search_term.lower() in extracted_text.lower():
+# Case-insensitive search; fold both sides once and reuse them (casefold also handles e.g. "ß")
+haystack_folded = extracted_text.casefold()
+needle_folded = search_term.casefold()
+found_folded = needle_folded in haystack_folded
+if found_folded:
     print(f"✓ FOUND (case-insensitive)")
-    idx_lower = extracted_text.lower().find(search_term.lower())
-    print(f"  Position: {idx_lower}")
-    actual_text = extracted_text[idx_lower:idx_lower+len(search_term)]
-    print(f"  Actual text: '{actual_text}'")
+    # Folding can change string lengths, so take the position from the original text
+    first_match = pattern.search(extracted_text)
+    if first_match:
+        print(f"  Position: {first_match.start()}")
+        print(f"  Actual text: '{first_match.group()}'")
+    else:
+        print(f"  Position (folded text): {haystack_folded.find(needle_folded)}")
 else:
     print(f"✗ NOT FOUND (case-insensitive)")
 
 # Test regex pattern matching (from the actual code)
 print(f"\n5. TESTING REGEX PATTERN (from _extract_criterion_paragraph)")
 print("-" * 80)
-pattern = re.compile(rf"{re.escape(search_term)}", re.IGNORECASE)
 matches = pattern.findall(extracted_text)
 print(f"Pattern: {pattern.pattern}")
 print(f"Found {len(matches)} matches")
@@ -111,8 +122,8 @@ else:
 # Show all lines containing "Team"
 print(f"\n6. ALL LINES CONTAINING 'team' (case-insensitive)")
 print("-" * 80)
-lines = extracted_text.splitlines()
-team_lines = [line for line in lines if "team" in line.lower()]
+# One case-insensitive, line-anchored scan of the whole buffer instead of lower-casing every line
+team_lines = [m.group() for m in re.finditer(r"(?im)^.*team.*$", extracted_text)]
 print(f"Found {len(team_lines)} lines containing 'team'")
 for idx, line in enumerate(team_lines[:10]):  # Show first 10
     print(f"  {idx + 1}. {line.strip()}")
@@ -121,7 +132,7 @@ print("\n" + "=" * 80)
 print("TEST COMPLETE")
 print("=" * 80)
 
-if search_term.lower() in extracted_text.lower():
+if found_folded:
     print("✓ SUCCESS: OCR successfully extracted the text and found the header!")
 else:
     print("✗ FAILED: Header not found in OCR-extracted text")
@@ -31,6 +31,9 @@ print("-" * 80)
 
 # Search for the header
 search_term = "Team Management and Delivery Governance"
+# Lowercase once; reused by the case-insensitive search and the line listing below
+text_lower = text.lower()
+needle_lower = search_term.lower()
 print(f"\n3. SEARCHING FOR: '{search_term}'")
 print("-" * 80)
 
@@ -44,9 +47,9 @@ else:
     print(f"X NOT FOUND (exact case)")
 
 # Case-insensitive search
-if search_term.lower() in text.lower():
+idx_lower = text_lower.find(needle_lower)
+if idx_lower != -1:
     print(f"OK FOUND (case-insensitive)")
-    idx_lower = text.lower().find(search_term.lower())
     print(f"  Position: {idx_lower}")
     actual_text = text[idx_lower:idx_lower+len(search_term)]
     print(f"  Actual text: '{actual_text}'")
@@ -64,12 +67,12 @@ auto_increment = False
 if not auto_increment:
     # Pattern from the code for non-auto-increment
     pattern = re.compile(rf"{re.escape(search_label)}", re.IGNORECASE)
-    matches = pattern.findall(text)
+    matches = list(pattern.finditer(text))
     print(f"Pattern: {pattern.pattern}")
     print(f"Found {len(matches)} matches")
     if matches:
-        print(f"Matches: {matches}")
-        for match in pattern.finditer(text):
+        print(f"Matches: {[match.group() for match in matches]}")
+        for match in matches:
             print(f"  - Position {match.start()}: '{match.group()}'")
     else:
         print("X NO MATCHES")
@@ -93,8 +96,8 @@ for variant in team_mgmt_variants:
 print(f"\n6. ALL LINES CONTAINING 'Team':")
 print("-" * 80)
 lines = text.splitlines()
-for idx, line in enumerate(lines):
-    if "team" in line.lower():
+for idx, (line, line_lower) in enumerate(zip(lines, text_lower.splitlines())):
+    if "team" in line_lower:
         print(f"Line {idx}: {repr(line.strip())}")
 
 # Check for images
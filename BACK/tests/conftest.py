@@ -0,0 +1,7 @@
+import os
+import sys
+from pathlib import Path
+
+# main.py builds its EEA client at import time; tests never reach the LLM
+os.environ.setdefault("EEA_API_KEY", "test")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
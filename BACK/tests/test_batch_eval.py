@@ -0,0 +1,13 @@
+import batch_eval
+
+
+def test_custom_id_round_trip_keeps_colons_in_q_id():
+    custom_id = batch_eval.make_custom_id(3, "Q:4", "Our answer")
+
+    assert batch_eval.split_custom_id(custom_id) == (3, "Q:4", batch_eval.answer_digest("Our answer"))
+
+
+def test_custom_id_without_digest_is_still_read():
+    # Jobs submitted before the answer digest was added
+    assert batch_eval.split_custom_id("3:Q4") == (3, "Q4", None)
+    assert batch_eval.split_custom_id("3:Q:4") == (3, "Q:4", None)
@@ -0,0 +1,57 @@
+from types import SimpleNamespace
+
+import fitz
+import pytest
+
+import main
+
+
+@pytest.fixture(autouse=True)
+def no_ocr(monkeypatch):
+    monkeypatch.setattr(main, "_get_openai_client", lambda: None)
+
+
+def _make_pdf(path, pages):
+    doc = fitz.open()
+    for lines in pages:
+        page = doc.new_page()
+        page.insert_text((72, 72), "\n".join(lines))
+    doc.save(str(path))
+    return path
+
+
+def _extract(pdf_path, q_id="2", search_label="Criterion"):
+    question = SimpleNamespace(q_id=q_id, search_label=search_label, auto_increment=True)
+    # No OCR runs, so the session only needs an empty list of pending rows
+    return main._extract_criterion_paragraph(pdf_path, question, SimpleNamespace(new=[]))
+
+
+def test_contents_page_without_dot_leaders_is_skipped(tmp_path):
+    pdf_path = _make_pdf(tmp_path / "contents.pdf", [
+        ["Contents", "Criterion 2 Team Management", "Criterion 3 Integration", "Filler text for the contents page"],
+        ["Criterion 2 Team Management", "We staff a PM and a lead architect.", "Criterion 3 Integration", "Other answer"],
+    ])
+
+    assert _extract(pdf_path) == (
+        "Criterion 2 Team Management",
+        "Criterion 2 Team Management\nWe staff a PM and a lead architect."
+    )
+
+
+def test_section_is_closed_by_next_header(tmp_path):
+    pdf_path = _make_pdf(tmp_path / "plain.pdf", [
+        ["Introduction with enough text to not look like a scanned page at all"],
+        ["Criterion 2 Team Management", "Body line one", "Body line two", "Criterion 3 Integration", "Other"],
+    ])
+
+    header, paragraph = _extract(pdf_path)
+    assert header == "Criterion 2 Team Management"
+    assert paragraph.splitlines()[1:] == ["Body line one", "Body line two"]
+
+
+def test_missing_section_returns_none(tmp_path):
+    pdf_path = _make_pdf(tmp_path / "missing.pdf", [
+        ["Criterion 1 Scope", "Only the first criterion is answered in this document"],
+    ])
+
+    assert _extract(pdf_path) is None